@@ -4,35 +4,87 @@ import io
 import base64
 import webbrowser
 import subprocess
+import numpy as np
 from PIL import Image
 
+# libjpeg-turbo via PyTurboJPEG is optional; Pillow's encoder is the fallback
+try:
+    from turbojpeg import TurboJPEG, TJSAMP_420, TJPF_RGB
+    HAS_TURBOJPEG = True
+except ImportError:
+    HAS_TURBOJPEG = False
+
+# JPEG quality for reverse-image-search uploads (search backends re-encode anyway)
+SEARCH_JPEG_QUALITY = 75
+
 class ImageSearchHandler:
     def __init__(self):
         self.temp_dir = tempfile.gettempdir()
+        # Files removed by cleanup_temp_files, resolved once
+        self._temp_files = (
+            os.path.join(os.path.expanduser("~"), "Desktop", "circle_search_image.jpg"),
+        )
+        self._tj = None
+        self._tj_unavailable = not HAS_TURBOJPEG
+    
+    def _get_turbojpeg(self):
+        """Lazily load the libjpeg-turbo encoder, or None if unavailable"""
+        if self._tj is None and not self._tj_unavailable:
+            try:
+                self._tj = TurboJPEG()
+            except Exception as e:
+                # PyTurboJPEG is installed but the native library is missing
+                print(f"[INFO] libjpeg-turbo not available, using Pillow: {e}")
+                self._tj_unavailable = True
+        return self._tj
     
-    def prepare_image_for_search(self, pil_image: Image.Image):
-        """Prepare image for search with multiple formats"""
-        # Save to temporary file (JPEG for compatibility)
-        temp_path = os.path.join(self.temp_dir, "circle_search_temp.jpg")
+    def prepare_image_for_search(self, image):
+        """Prepare image for search, encoded in memory as JPEG
+        
+        Accepts a PIL image or an HxWx3 RGB uint8 numpy array (e.g. the same
+        capture buffer handed to OCR). Pillow copies RGB arrays into the image,
+        so the caller's buffer is never written to. Convert BGRA captures to
+        RGB first; other shapes raise ValueError.
         
-        # Optimize image for web upload (reduce size if too large)
-        img = pil_image.copy()
+        Returns a bytes-like object: on the Pillow path this is a zero-copy
+        memoryview over the encode buffer, which stays valid for as long as
+        the caller holds it. Use bytes(...) if an owned copy is needed.
+        """
+        arr = None
+        if not isinstance(image, Image.Image):
+            arr = np.ascontiguousarray(image, dtype=np.uint8)
+            if arr.ndim != 3 or arr.shape[2] != 3:
+                raise ValueError(f"Expected an HxWx3 RGB array, got shape {arr.shape}")
+            height, width = arr.shape[:2]
+            image = Image.frombuffer("RGB", (width, height), arr, "raw", "RGB", 0, 1)
+        
+        # JPEG needs RGB; converting once here avoids the encoder's hidden
+        # conversion (convert() already returns a new image)
+        img = image if image.mode == "RGB" else image.convert("RGB")
         
         # Resize if image is too large (max 1920x1080 for faster upload)
         max_size = (1920, 1080)
         if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
+            if img is image:
+                img = img.copy()  # thumbnail() resizes in place
             img.thumbnail(max_size, Image.Resampling.LANCZOS)
             print(f"[INFO] Image resized to {img.size} for faster search")
         
-        # Save optimized image
-        img.save(temp_path, "JPEG", quality=85, optimize=True)
-        
-        # Read as bytes
-        with open(temp_path, 'rb') as f:
-            image_bytes = f.read()
+        # Encode straight into memory - no temp file round-trip
+        tj = self._get_turbojpeg()
+        if tj is not None:
+            if arr is None or img is not image:
+                arr = np.asarray(img)
+            image_bytes = tj.encode(arr, quality=SEARCH_JPEG_QUALITY,
+                                    pixel_format=TJPF_RGB, jpeg_subsample=TJSAMP_420)
+        else:
+            buf = io.BytesIO()
+            img.save(buf, format="JPEG", quality=SEARCH_JPEG_QUALITY,
+                     optimize=False, progressive=False, subsampling=2)
+            image_bytes = buf.getbuffer()
         
         print(f"[INFO] Image prepared: {len(image_bytes)} bytes")
-        return image_bytes, temp_path
+        return image_bytes, None
     
     def save_to_desktop_for_upload(self, pil_image: Image.Image):
         """Save image to desktop for easy manual upload"""
@@ -87,8 +139,12 @@ class ImageSearchHandler:
             print(f"[ERROR] Could not copy to clipboard: {e}")
             return False
     
-    def perform_advanced_search(self, pil_image: Image.Image, search_engine="google"):
-        """Perform advanced image search with multiple fallback methods"""
+    def perform_advanced_search(self, pil_image: Image.Image, search_engine="google", open_browser=True):
+        """Perform advanced image search with multiple fallback methods
+        
+        With open_browser=False the search page URL is only returned, so a
+        background caller can open it from the GUI thread.
+        """
         try:
             # Method 1: Try to copy to clipboard for easy pasting
             clipboard_success = self.copy_to_clipboard_windows(pil_image)
@@ -104,11 +160,11 @@ class ImageSearchHandler:
                 search_url = "https://www.bing.com/visualsearch"
                 upload_hint = "Click 'Browse' or drag-and-drop your image"
             
-            webbrowser.open(search_url)
+            if open_browser:
+                webbrowser.open(search_url)
+                print(f"[INFO] {search_engine.title()} opened for image search")
             
             # Provide user instructions
-            print(f"[INFO] {search_engine.title()} opened for image search")
-            
             if clipboard_success:
                 print("✅ Image copied to clipboard - you can paste it directly!")
             elif desktop_path:
@@ -125,15 +181,11 @@ class ImageSearchHandler:
     
     def cleanup_temp_files(self):
         """Clean up temporary files"""
-        temp_files = [
-            os.path.join(self.temp_dir, "circle_search_temp.jpg"),
-            os.path.join(os.path.expanduser("~"), "Desktop", "circle_search_image.jpg")
-        ]
-        
-        for temp_path in temp_files:
+        for temp_path in self._temp_files:
             try:
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
-                    print(f"[INFO] Cleaned up: {temp_path}")
-            except Exception as e:
+                os.unlink(temp_path)
+                print(f"[INFO] Cleaned up: {temp_path}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
                 print(f"[WARNING] Could not clean up {temp_path}: {e}")
\ No newline at end of file
@@ -1,17 +1,34 @@
-from PIL import Image, ImageDraw
 import os
+import sys
 
-# Create a simple icon
-img = Image.new('RGBA', (64, 64), (0, 0, 0, 0))
-draw = ImageDraw.Draw(img)
+ICON_PATH = 'assets/icon.png'
 
-# Draw a search circle
-draw.ellipse([10, 10, 54, 54], outline=(0, 100, 255, 255), width=4)
-draw.ellipse([35, 35, 45, 45], fill=(0, 100, 255, 255))
+# The icon is committed to the repo; only rebuild it on request
+if os.path.exists(ICON_PATH) and '--force' not in sys.argv:
+    print(f"Icon already exists at {ICON_PATH} (use --force to regenerate)")
+    sys.exit(0)
+
+from PIL import Image
+import numpy as np
+
+# Create a simple icon from vectorized distance masks
+COLOR = (0, 100, 255, 255)
+yy, xx = np.ogrid[:64, :64]
+r2 = (xx - 32) ** 2 + (yy - 32) ** 2
+
+# 11x11 sprite for the dot, stamped into place rather than tested per pixel
+dy, dx = np.ogrid[-5:6, -5:6]
+DOT_MASK = dx ** 2 + dy ** 2 <= 5 ** 2
+
+# Draw a search circle (4px ring) with a dot in the lower-right
+rgba = np.zeros((64, 64, 4), np.uint8)
+rgba[(r2 <= 22 ** 2) & (r2 > 18 ** 2)] = COLOR
+rgba[35:46, 35:46][DOT_MASK] = COLOR
+img = Image.frombuffer("RGBA", (64, 64), rgba, "raw", "RGBA", 0, 1)
 
 # Create assets directory if it doesn't exist
 os.makedirs('assets', exist_ok=True)
 
 # Save the icon
-img.save('assets/icon.png')
-print("Icon created at assets/icon.png")
\ No newline at end of file
+img.save(ICON_PATH)
+print(f"Icon created at {ICON_PATH}")
\ No newline at end of file
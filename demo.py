@@ -6,8 +6,53 @@ Quick demo and functionality test for Circle to Search
 import sys
 import os
 import time
+import functools
 import tempfile
-from PIL import Image, ImageDraw, ImageFont
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageDraw
+
+@functools.lru_cache(maxsize=None)
+def _font(size):
+    """Load a system font at the given size once, falling back to the default"""
+    from PIL import ImageFont
+    
+    for path in ("arial.ttf", "C:/Windows/Fonts/arial.ttf"):
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            pass
+    return ImageFont.load_default()
+
+# Body text of the demo screen: (position, text, color), all drawn in one font
+DEMO_TEXT_LINES = (
+    ((50, 120), "Select this text to test OCR", 'blue'),
+    ((50, 160), "Email: test@example.com", 'green'),
+    ((50, 200), "Phone: (555) 123-4567", 'red'),
+    ((50, 240), "Address: 123 Main St, City", 'purple'),
+    ((50, 280), "Website: https://example.com", 'orange'),
+    ((470, 200), "Test Shape", 'blue'),
+    ((470, 330), "Search Me!", 'red'),
+)
+
+# EasyOCR reader, loaded once and reused across OCR tests
+_reader = None
+_reader_lock = threading.Lock()
+
+def _get_reader():
+    """Return the shared EasyOCR reader, creating it on first use"""
+    global _reader
+    with _reader_lock:
+        if _reader is None:
+            import easyocr
+            try:
+                import torch
+                use_gpu = torch.cuda.is_available()
+            except Exception:
+                use_gpu = False
+            print(f"⚙️  OCR backend: {'GPU (CUDA)' if use_gpu else 'CPU'}")
+            _reader = easyocr.Reader(['en'], gpu=use_gpu)
+        return _reader
 
 def create_test_screen():
     """Create a test image with text to demonstrate OCR"""
@@ -18,44 +63,29 @@ def create_test_screen():
     draw = ImageDraw.Draw(img)
     
     # Try to use a system font
-    try:
-        title_font = ImageFont.truetype("arial.ttf", 36)
-        text_font = ImageFont.truetype("arial.ttf", 24)
-    except:
-        try:
-            title_font = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", 36)
-            text_font = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", 24)
-        except:
-            title_font = ImageFont.load_default()
-            text_font = ImageFont.load_default()
+    title_font = _font(36)
+    text_font = _font(24)
     
-    # Add various text elements
+    # Title and shapes first, then all body text in one pass over the cached font
     draw.text((50, 50), "Circle to Search Demo", fill='black', font=title_font)
-    draw.text((50, 120), "Select this text to test OCR", fill='blue', font=text_font)
-    draw.text((50, 160), "Email: test@example.com", fill='green', font=text_font)
-    draw.text((50, 200), "Phone: (555) 123-4567", fill='red', font=text_font)
-    draw.text((50, 240), "Address: 123 Main St, City", fill='purple', font=text_font)
-    draw.text((50, 280), "Website: https://example.com", fill='orange', font=text_font)
-    
-    # Add some shapes for image search testing
     draw.rectangle([450, 150, 650, 250], outline='blue', width=3)
     draw.ellipse([450, 300, 650, 400], outline='red', width=3)
-    draw.text((470, 200), "Test Shape", fill='blue', font=text_font)
-    draw.text((470, 330), "Search Me!", fill='red', font=text_font)
+    for xy, text, color in DEMO_TEXT_LINES:
+        draw.text(xy, text, fill=color, font=text_font)
     
     # Save the test image to desktop for easy access
     desktop = os.path.join(os.path.expanduser("~"), "Desktop")
-    test_image_path = os.path.join(desktop, "circle_to_search_demo.png")
+    test_image_path = os.path.join(desktop, "circle_to_search_demo.webp")
     
     try:
-        img.save(test_image_path)
+        img.save(test_image_path, "WEBP", quality=80, method=0)
         print(f"✅ Test image saved to: {test_image_path}")
         print("📸 Open this image to test the Circle to Search functionality!")
         return test_image_path
     except Exception as e:
         # Fallback to temp directory
-        temp_path = os.path.join(tempfile.gettempdir(), "circle_to_search_demo.png")
-        img.save(temp_path)
+        temp_path = os.path.join(tempfile.gettempdir(), "circle_to_search_demo.webp")
+        img.save(temp_path, "WEBP", quality=80, method=0)
         print(f"✅ Test image saved to: {temp_path}")
         return temp_path
 
@@ -63,20 +93,19 @@ def check_app_status():
     """Check if the Circle to Search app is running"""
     print("\n🔍 Checking application status...")
     
-    # Check for lock file
-    from PySide6.QtCore import QDir
-    import tempfile
+    # Check for lock file (tempfile resolves the same directory as QDir.tempPath)
+    lock_file_path = os.path.join(tempfile.gettempdir(), "circle-to-search.lock")
     
-    lock_file_path = os.path.join(QDir.tempPath(), "circle-to-search.lock")
-    
-    if os.path.exists(lock_file_path):
-        print("✅ Circle to Search is currently running!")
-        print("👀 Look for the icon in your system tray (bottom-right corner)")
-        return True
-    else:
+    try:
+        os.stat(lock_file_path)
+    except FileNotFoundError:
         print("❌ Circle to Search is not running")
         print("🚀 Run: python main_simple.py to start the application")
         return False
+    
+    print("✅ Circle to Search is currently running!")
+    print("👀 Look for the icon in your system tray (bottom-right corner)")
+    return True
 
 def show_usage_instructions():
     """Show detailed usage instructions"""
@@ -107,33 +136,24 @@ def test_ocr_capability():
     print("\n🧪 Testing OCR capability...")
     
     try:
-        import easyocr
+        import numpy as np
         
         # Create a simple test image
         img = Image.new('RGB', (400, 100), color='white')
         draw = ImageDraw.Draw(img)
         
-        try:
-            font = ImageFont.truetype("arial.ttf", 24)
-        except:
-            font = ImageFont.load_default()
+        font = _font(24)
         
         draw.text((10, 30), "Test OCR: Hello World 123", fill='black', font=font)
         
-        # Save to temp file
-        temp_path = os.path.join(tempfile.gettempdir(), "ocr_test.png")
-        img.save(temp_path)
-        
         print("🔄 Running OCR test...")
-        reader = easyocr.Reader(['en'], gpu=False)
-        result = reader.readtext(temp_path)
+        reader = _get_reader()
+        # Pass pixels directly - no PNG save/decode round-trip
+        result = reader.readtext(np.asarray(img))
         
         recognized_text = " ".join([text for bbox, text, conf in result])
         print(f"✅ OCR Result: '{recognized_text}'")
         
-        # Cleanup
-        os.remove(temp_path)
-        
         if "Hello" in recognized_text and "World" in recognized_text:
             print("🎉 OCR is working perfectly!")
         else:
@@ -147,14 +167,20 @@ def main():
     print("🚀 Circle to Search - Demo & Status Check")
     print("=" * 50)
     
+    # Load the OCR model in the background while the quick checks run;
+    # the steps themselves stay sequential so their output is not interleaved
+    executor = ThreadPoolExecutor(max_workers=1)
+    executor.submit(_get_reader)
+    
     # Check if app is running
     app_running = check_app_status()
     
     # Create demo image
     demo_image = create_test_screen()
     
-    # Test OCR
+    # Test OCR (waits for the background model load if still running)
     test_ocr_capability()
+    executor.shutdown(wait=False)
     
     # Show instructions
     show_usage_instructions()
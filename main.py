@@ -3,15 +3,15 @@
 
 import sys
 import os
+import atexit
+import functools
 import threading
+import queue
 import asyncio
 import io
-import mss
-import easyocr
 import numpy
 import json
 import webbrowser
-import pyperclip
 import time
 from datetime import datetime
 from pynput import keyboard
@@ -29,8 +29,8 @@ from PySide6.QtGui import (
     QColor, QPen, QCursor, QKeySequence, QShortcut
 )
 from PySide6.QtCore import (
-    QObject, Signal, QThread, QTimer, QLockFile, QDir, QRect, Qt,
-    QSettings, QStandardPaths, QSize
+    QObject, Signal, QTimer, QLockFile, QDir, QRect, Qt,
+    QSettings, QStandardPaths, QSize, QRunnable, QThreadPool
 )
 
 # Local Imports
@@ -43,22 +43,37 @@ from core.search_engines import SearchEngineManager
 from core.image_search import ImageSearchHandler
 from utils.image_processing import ImageProcessor
 
-# Global OCR Reader
-EASYOCR_READER = None
+@functools.lru_cache(maxsize=128)
+def _encode_query(query):
+    """URL-encode a search query, memoized for repeat searches across engines"""
+    return quote_plus(query)
 
-def get_ocr_reader():
-    """Creates or returns the singleton OCR reader instance."""
-    global EASYOCR_READER
-    if EASYOCR_READER is None:
-        print("[INFO] Initializing EasyOCR Reader...")
-        EASYOCR_READER = easyocr.Reader(['en'], gpu=False)
-        print("[INFO] EasyOCR Reader initialized.")
-    return EASYOCR_READER
+class ImageSearchSignals(QObject):
+    """Signals for background image search tasks"""
+    finished = Signal(str, str)  # search url ('' on failure), engine
+
+class ImageSearchTask(QRunnable):
+    """Prepares the captured image for search off the GUI thread"""
+    
+    def __init__(self, handler, pil_image, engine, signals):
+        super().__init__()
+        self.handler = handler
+        self.pil_image = pil_image
+        self.engine = engine
+        self.signals = signals
+    
+    def run(self):
+        search_url = self.handler.perform_advanced_search(
+            self.pil_image, self.engine, open_browser=False)
+        self.signals.finished.emit(search_url or '', self.engine)
 
 class EnhancedSearchEngine:
     """Enhanced search engine with better Google integration"""
     
     def __init__(self):
+        self.image_search_handler = ImageSearchHandler()
+        self.image_search_signals = ImageSearchSignals()
+        self.image_search_signals.finished.connect(self._on_image_search_ready)
         self.base_urls = {
             'google_text': 'https://www.google.com/search',
             'google_images': 'https://www.google.com/search?tbm=isch',
@@ -75,7 +90,7 @@ class EnhancedSearchEngine:
         try:
             # Clean and encode the query
             clean_query = query.strip()
-            encoded_query = quote_plus(clean_query)
+            encoded_query = _encode_query(clean_query)
             
             if engine == 'google':
                 url = f"{self.base_urls['google_text']}?q={encoded_query}"
@@ -94,24 +109,11 @@ class EnhancedSearchEngine:
         """Enhanced image search with actual image upload"""
         try:
             if pil_image:
-                # Use the enhanced image search handler
-                from core.image_search import ImageSearchHandler
-                handler = ImageSearchHandler()
-                
-                # Perform advanced search with the actual image
-                search_url = handler.perform_advanced_search(pil_image, engine)
-                
-                if search_url:
-                    print(f"[INFO] {engine.title()} image search opened with captured image!")
-                    return True
-                else:
-                    # Fallback to regular URL opening
-                    if engine == 'google':
-                        webbrowser.open(self.base_urls['google_lens'])
-                    else:
-                        webbrowser.open('https://www.bing.com/visualsearch')
-                    print(f"[INFO] Opened {engine} image search (fallback)")
-                    return True
+                # Clipboard copy and desktop save run in the thread pool;
+                # the browser is opened back on the GUI thread when ready
+                QThreadPool.globalInstance().start(ImageSearchTask(
+                    self.image_search_handler, pil_image, engine, self.image_search_signals))
+                return True
             else:
                 # No image provided, just open the search page
                 if engine == 'google':
@@ -125,15 +127,29 @@ class EnhancedSearchEngine:
             print(f"[ERROR] Image search failed: {e}")
             return False
 
+    def _on_image_search_ready(self, search_url, engine):
+        """Open the prepared image search page (GUI thread)"""
+        if search_url:
+            webbrowser.open(search_url)
+            print(f"[INFO] {engine.title()} image search opened with captured image!")
+        else:
+            # Fallback to regular URL opening
+            if engine == 'google':
+                webbrowser.open(self.base_urls['google_lens'])
+            else:
+                webbrowser.open('https://www.bing.com/visualsearch')
+            print(f"[INFO] Opened {engine} image search (fallback)")
+
 class SettingsManager:
     """Manages application settings"""
     
     def __init__(self):
         self.settings = QSettings('CircleToSearch', 'Settings')
+        self._cache = {}
         self.load_defaults()
     
     def load_defaults(self):
-        """Load default settings"""
+        """Load default settings and cache their typed values"""
         defaults = {
             'hotkey': 'ctrl+shift+space',
             'search_engine': 'google',
@@ -147,19 +163,46 @@ class SettingsManager:
         for key, value in defaults.items():
             if not self.settings.contains(key):
                 self.settings.setValue(key, value)
+            self._cache[key] = self._coerce(self.settings.value(key, value), value)
+    
+    @staticmethod
+    def _coerce(value, default):
+        """Convert a stored value (ini backends return strings) to the default's type"""
+        if isinstance(default, bool):
+            return value in (True, 'true', 'True', '1', 1)
+        if isinstance(default, int):
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                return default
+        return value
     
     def get(self, key, default=None):
-        return self.settings.value(key, default)
+        if key not in self._cache:
+            self._cache[key] = self.settings.value(key, default)
+        return self._cache[key]
     
     def set(self, key, value):
+        self._cache[key] = value
         self.settings.setValue(key, value)
 
 class SearchHistory:
     """Manages search history"""
     
+    SAVE_DELAY_MS = 2000
+    
     def __init__(self, max_size=50):
         self.max_size = max_size
         self.history = []
+        self._dirty = False
+        self._display_cache = {}  # limit -> formatted history text
+        
+        # Debounce writes so OCR results never wait on disk I/O
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.flush)
+        
         self.load_history()
     
     def add_search(self, text, timestamp=None):
@@ -180,14 +223,34 @@ class SearchHistory:
         if len(self.history) > self.max_size:
             self.history = self.history[:self.max_size]
         
-        self.save_history()
+        self._dirty = True
+        self._display_cache.clear()
+        self._save_timer.start()
     
     def get_history(self):
         return self.history
     
+    def get_display(self, limit=10):
+        """Recent searches formatted for display, rebuilt only after changes"""
+        if limit not in self._display_cache:
+            self._display_cache[limit] = "\n".join([
+                f"{item['timestamp'][:19]}: {item['text'][:50]}{'...' if len(item['text']) > 50 else ''}"
+                for item in self.history[:limit]
+            ])
+        return self._display_cache[limit]
+    
     def clear_history(self):
         self.history = []
-        self.save_history()
+        self._dirty = True
+        self._display_cache.clear()
+        self.flush()
+    
+    def flush(self):
+        """Write pending history changes to disk"""
+        self._save_timer.stop()
+        if self._dirty:
+            self.save_history()
+            self._dirty = False
     
     def load_history(self):
         """Load history from file"""
@@ -209,9 +272,12 @@ class SearchHistory:
             os.makedirs(app_data_dir, exist_ok=True)
             
             history_file = os.path.join(app_data_dir, 'search_history.json')
+            temp_file = history_file + '.tmp'
             
-            with open(history_file, 'w', encoding='utf-8') as f:
+            # Write to a temp file and swap it in so a crash never truncates history
+            with open(temp_file, 'w', encoding='utf-8') as f:
                 json.dump(self.history, f, indent=2, ensure_ascii=False)
+            os.replace(temp_file, history_file)
         except Exception as e:
             print(f"[WARNING] Could not save history: {e}")
 
@@ -237,6 +303,14 @@ class NotificationManager:
             2000
         )
 
+# Hotkeys offered in the settings window (display name -> pynput combination)
+HOTKEY_CHOICES = {
+    "Ctrl+Shift+Space": "<ctrl>+<shift>+<space>",
+    "Ctrl+Alt+S": "<ctrl>+<alt>+s",
+    "Ctrl+Shift+C": "<ctrl>+<shift>+c",
+    "Alt+Space": "<alt>+<space>"
+}
+
 class EnhancedHotkeyListener(QObject):
     """Enhanced hotkey listener with configurable keys"""
     hotkey_pressed = Signal()
@@ -246,11 +320,27 @@ class EnhancedHotkeyListener(QObject):
         self.hotkey_combination = hotkey_combination
         self.listener = None
         self.active = False
+        self.registered_hotkeys = set()
 
     def start_listening(self):
         if not self.active:
+            try:
+                # Register every selectable hotkey up front so switching between
+                # them is just a dispatch change, not a listener restart. Built
+                # here so stop/update see them as soon as this returns
+                self.registered_hotkeys = set(HOTKEY_CHOICES.values()) | {self.hotkey_combination}
+                bindings = {
+                    combo: functools.partial(self._dispatch, combo)
+                    for combo in self.registered_hotkeys
+                }
+                self.listener = keyboard.GlobalHotKeys(bindings)
+            except Exception as e:
+                print(f"[ERROR] Failed to start hotkey listener: {e}")
+                self.registered_hotkeys = set()
+                return
+            
             self.active = True
-            listener_thread = threading.Thread(target=self._run, daemon=True)
+            listener_thread = threading.Thread(target=self._run, args=(self.listener,), daemon=True)
             listener_thread.start()
             print(f"[INFO] Hotkey listener started: {self.hotkey_combination}")
 
@@ -258,14 +348,25 @@ class EnhancedHotkeyListener(QObject):
         self.active = False
         if self.listener:
             self.listener.stop()
+            self.listener = None
+        self.registered_hotkeys = set()
 
-    def _run(self):
+    def _run(self, listener):
         try:
-            with keyboard.GlobalHotKeys({self.hotkey_combination: self._on_activate}) as self.listener:
-                while self.active:
-                    time.sleep(0.1)
+            # pynput is event-driven: block on the listener until stop() is called
+            listener.start()
+            listener.wait()
+            if listener is not self.listener:
+                # stop_listening() ran before the listener was up, when
+                # pynput's stop() is still a no-op
+                listener.stop()
+            listener.join()
         except Exception as e:
-            print(f"[ERROR] Failed to start hotkey listener: {e}")
+            print(f"[ERROR] Hotkey listener failed: {e}")
+
+    def _dispatch(self, combo):
+        if combo == self.hotkey_combination:
+            self._on_activate()
 
     def _on_activate(self):
         if self.active:
@@ -274,6 +375,11 @@ class EnhancedHotkeyListener(QObject):
 
     def update_hotkey(self, new_hotkey):
         """Update the hotkey combination"""
+        if self.active and new_hotkey in self.registered_hotkeys:
+            # Already bound by the running listener
+            self.hotkey_combination = new_hotkey
+            return
+        
         was_active = self.active
         if was_active:
             self.stop_listening()
@@ -283,51 +389,132 @@ class EnhancedHotkeyListener(QObject):
         if was_active:
             self.start_listening()
 
-class EnhancedOcrWorker(QThread):
-    """Enhanced OCR worker with multiple engines and languages"""
-    finished = Signal(str, float)  # text, confidence
+class OcrService(QObject):
+    """Long-lived OCR worker thread fed from a request queue"""
+    finished = Signal(object, str, float)  # capture context, text, confidence
     error = Signal(str)
     progress = Signal(int)
 
-    def __init__(self, pil_image, language='en'):
+    # Captures arriving within this window are recognized as one batch
+    BATCH_WINDOW = 0.05
+    MAX_PENDING = 4
+
+    def __init__(self, get_reader, preprocess=None, language='en'):
         super().__init__()
-        self.pil_image = pil_image
+        self.get_reader = get_reader
+        self.preprocess = preprocess
         self.language = language
+        self.requests = queue.Queue(maxsize=self.MAX_PENDING)
+        self.worker_thread = threading.Thread(target=self._run, daemon=True)
+        self.worker_thread.start()
 
-    def run(self):
-        """Enhanced OCR processing"""
+    def submit(self, pil_image, context=None):
+        """Queue an image for OCR, dropping the oldest request if backed up
+        
+        context is handed back with the image's result.
+        """
+        while True:
+            try:
+                self.requests.put_nowait((pil_image, context))
+                return
+            except queue.Full:
+                try:
+                    self.requests.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def stop(self):
+        """Stop the worker thread once the current request finishes"""
+        self._drain()
+        self.requests.put_nowait(None)
+
+    def _drain(self):
+        try:
+            while True:
+                self.requests.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _run(self):
+        while True:
+            item = self.requests.get()
+            if item is None:
+                break
+            
+            # Coalesce captures made in rapid succession into one batch
+            batch = [item]
+            stopping = False
+            deadline = time.monotonic() + self.BATCH_WINDOW
+            while len(batch) < self.MAX_PENDING:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self.requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            self._process(batch)
+            if stopping:
+                break
+
+    def _process(self, batch):
+        """Enhanced OCR processing; results are emitted in submission order"""
         try:
             self.progress.emit(25)
             
-            # Get OCR reader
-            reader = get_ocr_reader()
+            # Get the application's shared OCR reader
+            reader = self.get_reader()
             self.progress.emit(50)
 
-            # Convert image to numpy array
-            image_np = numpy.array(self.pil_image)
+            # Enhance on this thread so the GUI thread stays free
+            images = [image for image, _ in batch]
+            if self.preprocess:
+                images = [self.preprocess(image) for image in images]
+            
+            # View the images as numpy arrays (no copy when strides allow)
+            images_np = [numpy.asarray(pil_image) for pil_image in images]
             self.progress.emit(75)
 
-            # Perform OCR with confidence scores
-            result = reader.readtext(image_np)
-            
-            # Extract text and calculate average confidence
-            recognized_texts = []
-            confidences = []
-            
-            for bbox, text, confidence in result:
-                if confidence > 0.3:  # Filter low-confidence results
-                    recognized_texts.append(text)
-                    confidences.append(confidence)
-            
-            full_text = "\n".join(recognized_texts)
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+            # Perform OCR with confidence scores; batches share one detector pass
+            if len(images_np) == 1:
+                results = [reader.readtext(images_np[0])]
+            else:
+                results = reader.readtext_batched(self._pad_to_common_size(images_np))
             
             self.progress.emit(100)
-            self.finished.emit(full_text, avg_confidence)
+            for (_, context), result in zip(batch, results):
+                self.finished.emit(context, *self._summarize(result))
 
         except Exception as e:
             self.error.emit(f"OCR Error: {repr(e)}")
 
+    @staticmethod
+    def _pad_to_common_size(images_np):
+        """Zero-pad (don't stretch) images into one canvas size for readtext_batched"""
+        h = max(image.shape[0] for image in images_np)
+        w = max(image.shape[1] for image in images_np)
+        padded = []
+        for image in images_np:
+            canvas = numpy.zeros((h, w) + image.shape[2:], dtype=numpy.uint8)
+            canvas[:image.shape[0], :image.shape[1]] = image
+            padded.append(canvas)
+        return padded
+
+    @staticmethod
+    def _summarize(result):
+        """Extract text and calculate average confidence"""
+        confidences = numpy.fromiter((c for _, _, c in result), dtype=numpy.float32, count=len(result))
+        mask = confidences > 0.3  # Filter low-confidence results
+        
+        full_text = "\n".join(result[i][1] for i in numpy.flatnonzero(mask))
+        avg_confidence = float(confidences[mask].mean()) if mask.any() else 0.0
+        return full_text, avg_confidence
+
 class SettingsWindow(QWidget):
     """Enhanced settings window"""
     
@@ -355,12 +542,7 @@ class SettingsWindow(QWidget):
         hotkey_layout = QHBoxLayout()
         hotkey_layout.addWidget(QLabel("Hotkey:"))
         self.hotkey_combo = QComboBox()
-        self.hotkey_combo.addItems([
-            "Ctrl+Shift+Space",
-            "Ctrl+Alt+S", 
-            "Ctrl+Shift+C",
-            "Alt+Space"
-        ])
+        self.hotkey_combo.addItems(list(HOTKEY_CHOICES))
         current_hotkey = self.settings_manager.get('hotkey', 'ctrl+shift+space')
         if 'shift' in current_hotkey and 'space' in current_hotkey:
             self.hotkey_combo.setCurrentText("Ctrl+Shift+Space")
@@ -401,14 +583,7 @@ class SettingsWindow(QWidget):
         """Save all settings"""
         # Update hotkey
         hotkey_text = self.hotkey_combo.currentText()
-        hotkey_map = {
-            "Ctrl+Shift+Space": "<ctrl>+<shift>+<space>",
-            "Ctrl+Alt+S": "<ctrl>+<alt>+s",
-            "Ctrl+Shift+C": "<ctrl>+<shift>+c",
-            "Alt+Space": "<alt>+<space>"
-        }
-        
-        new_hotkey = hotkey_map.get(hotkey_text, "<ctrl>+<shift>+<space>")
+        new_hotkey = HOTKEY_CHOICES.get(hotkey_text, "<ctrl>+<shift>+<space>")
         self.settings_manager.set('hotkey', new_hotkey)
         self.hotkey_listener.update_hotkey(new_hotkey)
         
@@ -440,22 +615,59 @@ class EnhancedTrayApplication(QObject):
         self.side_panel = EnhancedSidePanelWindow()
         self.settings_window = None
         
+        # OCR reader, held for the process lifetime
+        self.ocr_reader = None
+        self.ocr_reader_lock = threading.Lock()
+        
+        # OCR runs on one persistent worker thread
+        self.ocr_service = OcrService(self.get_ocr_reader, self.image_processor.enhance_for_ocr)
+        self.ocr_service.finished.connect(self.on_ocr_finished)
+        self.ocr_service.error.connect(self.handle_ocr_error)
+        self.app.aboutToQuit.connect(self.ocr_service.stop)
+        self.app.aboutToQuit.connect(self.search_history.flush)
+        
         # State
-        self.ocr_worker = None
         self.last_selection_rect = None
+        self.last_capture = None
         self.last_captured_image = None
+        
+        # Screen grabbers are reused per thread (mss handles are thread-bound)
+        self._sct = threading.local()
+        self._sct_instances = []
+        atexit.register(self._close_screen_grabbers)
         self.last_ocr_text = ""
+        self._last_clip = None  # Last text auto-copied to the clipboard
         
         # Connect signals
         self.overlay.region_selected.connect(self.on_region_selected)
         
         # Setup
         self.setup_tray_icon()
+        threading.Thread(target=self.warm_up_ocr_reader, daemon=True).start()
         self.setup_hotkey_listener()
         
         print("[DEBUG] Enhanced Circle to Search initialized!")
         print(f"[INFO] Hotkey: {self.settings_manager.get('hotkey')}")
 
+    def get_ocr_reader(self):
+        """Creates or returns the application's OCR reader instance."""
+        with self.ocr_reader_lock:
+            if self.ocr_reader is None:
+                print("[INFO] Initializing EasyOCR Reader...")
+                import easyocr  # Heavy (pulls in torch); imported by the warm-up thread
+                self.ocr_reader = easyocr.Reader(['en'], gpu=False, cudnn_benchmark=True)
+                print("[INFO] EasyOCR Reader initialized.")
+            return self.ocr_reader
+
+    def warm_up_ocr_reader(self):
+        """Load the OCR reader and run a dummy inference so the first capture is fast."""
+        try:
+            reader = self.get_ocr_reader()
+            reader.readtext(numpy.zeros((32, 32, 3), dtype=numpy.uint8))
+            print("[INFO] EasyOCR Reader warmed up.")
+        except Exception as e:
+            print(f"[WARNING] OCR warm-up failed: {e}")
+
     def setup_tray_icon(self):
         """Setup enhanced system tray icon"""
         icon_path = os.path.join(os.path.dirname(__file__), "assets/icon.png")
@@ -502,6 +714,7 @@ class EnhancedTrayApplication(QObject):
         search_menu.addAction(bing_action)
         
         menu.addMenu(search_menu)
+        self._engine_actions = {'google': google_action, 'bing': bing_action}
         
         # Settings
         settings_action = QAction("⚙️ Settings")
@@ -561,11 +774,27 @@ class EnhancedTrayApplication(QObject):
         print("[DEBUG] Showing capture overlay...")
         self.overlay.show_overlay()
 
+    def _get_sct(self):
+        """Return this thread's persistent mss screen grabber"""
+        sct = getattr(self._sct, 'inst', None)
+        if sct is None:
+            import mss
+            sct = self._sct.inst = mss.mss()
+            self._sct_instances.append(sct)
+        return sct
+
+    def _close_screen_grabbers(self):
+        for sct in self._sct_instances:
+            try:
+                sct.close()
+            except Exception:
+                pass
+        self._sct_instances.clear()
+
     def on_region_selected(self, rect: QRect):
         """Handle region selection with enhanced feedback"""
         print(f"[DEBUG] Region selected: {rect}")
         
-        self.last_selection_rect = rect
         selection_center = rect.center()
         screen = QGuiApplication.screenAt(selection_center) or QGuiApplication.primaryScreen()
         pixel_ratio = screen.devicePixelRatio()
@@ -582,33 +811,32 @@ class EnhancedTrayApplication(QObject):
             NotificationManager.show_capture_feedback()
         
         try:
-            with mss.mss() as sct:
-                sct_img = sct.grab(capture_rect)
-                pil_img = Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
-                
-                # Store the original image
-                self.last_captured_image = pil_img.copy()
-                
-                print("✅ Image captured, starting OCR...")
-                
-                # Stop any running OCR
-                if self.ocr_worker and self.ocr_worker.isRunning():
-                    self.ocr_worker.quit()
-                    self.ocr_worker.wait()
-
-                # Enhance image for OCR
-                enhanced_img = self.image_processor.enhance_for_ocr(pil_img.copy())
-                
-                # Start OCR
-                self.ocr_worker = EnhancedOcrWorker(enhanced_img)
-                self.ocr_worker.finished.connect(self.handle_ocr_result)
-                self.ocr_worker.error.connect(self.handle_ocr_error)
-                self.ocr_worker.start()
+            sct_img = self._get_sct().grab(capture_rect)
+            
+            # View the BGRA buffer as HxWx4 and reorder to contiguous RGB in one copy
+            bgra = numpy.frombuffer(sct_img.raw, dtype=numpy.uint8).reshape(
+                sct_img.height, sct_img.width, 4)
+            rgb = numpy.ascontiguousarray(bgra[:, :, 2::-1])
+            
+            print("✅ Image captured, starting OCR...")
+            
+            # Queue OCR (enhancement runs on the OCR thread)
+            self.ocr_service.submit(rgb, (rect, sct_img))
                 
         except Exception as e:
             print(f"[ERROR] Screen capture failed: {e}")
             QMessageBox.warning(None, "Capture Error", f"Failed to capture screen: {e}")
 
+    def on_ocr_finished(self, context, ocr_text, confidence):
+        """Make the recognised capture current, then handle its text"""
+        rect, sct_img = context
+        
+        # Keep the raw capture; the PIL image is only built for the side panel
+        self.last_selection_rect = rect
+        self.last_capture = sct_img
+        self.last_captured_image = None
+        self.handle_ocr_result(ocr_text, confidence)
+
     def handle_ocr_result(self, ocr_text, confidence):
         """Handle OCR results with enhanced features"""
         clean_text = ocr_text.strip()
@@ -617,9 +845,11 @@ class EnhancedTrayApplication(QObject):
         self.last_ocr_text = clean_text
         
         # Auto-copy if enabled
-        if self.settings_manager.get('auto_copy', True) and clean_text:
+        if self.settings_manager.get('auto_copy', True) and clean_text and clean_text != self._last_clip:
             try:
+                import pyperclip
                 pyperclip.copy(clean_text)
+                self._last_clip = clean_text
                 print("[INFO] Text copied to clipboard")
             except Exception as e:
                 print(f"[WARNING] Could not copy to clipboard: {e}")
@@ -651,12 +881,19 @@ class EnhancedTrayApplication(QObject):
         print(f"[ERROR] OCR failed: {error_message}")
         QMessageBox.warning(None, "OCR Error", f"Text recognition failed:\n{error_message}")
 
+    def get_captured_image(self):
+        """Build (once) the PIL image of the last capture"""
+        if self.last_captured_image is None and self.last_capture is not None:
+            self.last_captured_image = Image.frombytes(
+                "RGB", self.last_capture.size, self.last_capture.raw, "raw", "BGRX")
+        return self.last_captured_image
+
     def show_enhanced_side_panel(self, text, confidence):
         """Show enhanced side panel with more options"""
         # Update side panel with enhanced content
         self.side_panel.set_enhanced_content(
             text, 
-            self.last_captured_image,  # Pass the actual captured PIL image
+            self.get_captured_image(),  # Pass the actual captured PIL image
             self.search_engine,        # Pass our enhanced search engine
             confidence,
             self.settings_manager.get('search_engine', 'google')
@@ -669,12 +906,8 @@ class EnhancedTrayApplication(QObject):
         print(f"[INFO] Search engine set to: {engine_name}")
         
         # Update menu checkmarks
-        menu = self.tray_icon.contextMenu()
-        for action in menu.actions():
-            if hasattr(action, 'menu') and action.menu():
-                for sub_action in action.menu().actions():
-                    if sub_action.text() in ['Google', 'Bing']:
-                        sub_action.setChecked(sub_action.text().lower() == engine_name)
+        for name, action in self._engine_actions.items():
+            action.setChecked(name == engine_name)
 
     def show_settings(self):
         """Show settings window"""
@@ -687,17 +920,12 @@ class EnhancedTrayApplication(QObject):
 
     def show_history(self):
         """Show search history"""
-        history = self.search_history.get_history()
-        
-        if not history:
+        if not self.search_history.get_history():
             QMessageBox.information(None, "Search History", "No search history available.")
             return
         
-        # Create simple history dialog
-        history_text = "\n".join([
-            f"{item['timestamp'][:19]}: {item['text'][:50]}{'...' if len(item['text']) > 50 else ''}"
-            for item in history[:10]  # Show last 10
-        ])
+        # Create simple history dialog (last 10 searches)
+        history_text = self.search_history.get_display(10)
         
         QMessageBox.information(None, "Recent Searches", history_text)
 
@@ -1,13 +1,11 @@
 import sys
 import os
 import threading
-import mss
-import easyocr
 import numpy
 import webbrowser
-import pyperclip
 import tempfile
-import time
+import collections
+from datetime import datetime
 from urllib.parse import quote_plus
 
 # PySide6 Imports
@@ -15,8 +13,11 @@ from PySide6.QtWidgets import (
     QApplication, QMessageBox, 
     QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton, QLabel
 )
-from PySide6.QtGui import QFont, QGuiApplication
-from PySide6.QtCore import QObject, Signal, QThread, QTimer, QLockFile, QDir, QRect, Qt
+from PySide6.QtGui import QFont, QGuiApplication, QImage
+from PySide6.QtCore import (
+    QObject, Signal, QThread, QTimer, QLockFile, QDir, QRect, Qt,
+    QRunnable, QThreadPool
+)
 
 # Global hotkey import
 try:
@@ -38,6 +39,23 @@ class ImageSearchHandler:
     def __init__(self):
         self.temp_dir = tempfile.gettempdir()
         self.save_dir = self.create_save_directory()
+        
+        # Resolve the upload copy's location once instead of per capture
+        desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
+        if not os.path.isdir(desktop_path):
+            desktop_path = os.path.expanduser("~")
+        self._desktop_image_path = os.path.join(desktop_path, "circle_search_image.jpg")
+    
+    def _save_jpeg(self, pil_image: Image.Image, path, quality, max_size=None):
+        """Write a JPEG straight to path, copying only when a resize is needed"""
+        # Single-pass JPEG encode; only convert when the mode needs it
+        img = pil_image if pil_image.mode == "RGB" else pil_image.convert("RGB")
+        if max_size and (img.size[0] > max_size[0] or img.size[1] > max_size[1]):
+            if img is pil_image:
+                img = img.copy()  # thumbnail() resizes in place
+            img.thumbnail(max_size, Image.Resampling.LANCZOS)
+        
+        img.save(path, "JPEG", quality=quality, optimize=False, progressive=False)
     
     def create_save_directory(self):
         """Create directory to save captured files"""
@@ -56,25 +74,22 @@ class ImageSearchHandler:
     def save_capture_permanently(self, pil_image: Image.Image, ocr_text=""):
         """Save captured image and text permanently with timestamp"""
         try:
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            now = datetime.now()
+            base_path = f"{self.save_dir}{os.sep}capture_{now:%Y%m%d_%H%M%S}"
             
             # Save image
-            image_filename = f"capture_{timestamp}.jpg"
-            image_path = os.path.join(self.save_dir, image_filename)
+            image_path = f"{base_path}.jpg"
+            image_filename = os.path.basename(image_path)
             
-            # Optimize and save image
-            img = pil_image.copy()
-            img.save(image_path, "JPEG", quality=95, optimize=True)
+            self._save_jpeg(pil_image, image_path, 92)
             
             # Save text file if there's OCR text
             if ocr_text.strip():
-                text_filename = f"capture_{timestamp}.txt"
-                text_path = os.path.join(self.save_dir, text_filename)
+                text_path = f"{base_path}.txt"
                 
                 with open(text_path, 'w', encoding='utf-8') as f:
                     f.write(f"Circle to Search Capture\n")
-                    f.write(f"Timestamp: {datetime.now().isoformat()}\n")
+                    f.write(f"Timestamp: {now.isoformat()}\n")
                     f.write(f"Image File: {image_filename}\n")
                     f.write(f"\n--- Recognized Text ---\n")
                     f.write(ocr_text)
@@ -89,14 +104,18 @@ class ImageSearchHandler:
             print(f"[ERROR] Could not save capture: {e}")
             return None, None
     
-    def perform_image_search(self, pil_image: Image.Image, engine='google'):
-        """Perform image search with actual image data"""
+    def perform_image_search(self, pil_image: Image.Image, engine='google', clipboard_done=False):
+        """Perform image search with actual image data
+        
+        Pass clipboard_done=True when the caller already put the image on
+        the clipboard (e.g. via Qt on the GUI thread).
+        """
         try:
             # Method 1: Save image to desktop for easy upload
             desktop_path = self.save_to_desktop(pil_image)
             
             # Method 2: Try to copy to clipboard (Windows)
-            clipboard_success = self.copy_to_clipboard_windows(pil_image)
+            clipboard_success = clipboard_done or self.copy_to_clipboard_windows(pil_image)
             
             # Method 3: Open Google (always use Google as requested)
             search_url = "https://images.google.com/"
@@ -124,19 +143,10 @@ class ImageSearchHandler:
     def save_to_desktop(self, pil_image: Image.Image):
         """Save image to desktop for easy upload"""
         try:
-            desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
-            if not os.path.exists(desktop_path):
-                desktop_path = os.path.expanduser("~")
-            
-            image_path = os.path.join(desktop_path, "circle_search_image.jpg")
-            
-            # Optimize image size
-            img = pil_image.copy()
-            max_size = (1920, 1080)
-            if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
-                img.thumbnail(max_size, Image.Resampling.LANCZOS)
+            image_path = self._desktop_image_path
             
-            img.save(image_path, "JPEG", quality=90, optimize=True)
+            # Google downscales uploads anyway: cap the size, lower the quality
+            self._save_jpeg(pil_image, image_path, 85, (1920, 1080))
             return image_path
             
         except Exception as e:
@@ -146,14 +156,17 @@ class ImageSearchHandler:
     def copy_to_clipboard_windows(self, pil_image: Image.Image):
         """Copy image to Windows clipboard"""
         try:
-            import io
+            import struct
             import win32clipboard
             
-            # Convert to bitmap format
-            output = io.BytesIO()
-            pil_image.convert("RGB").save(output, "BMP")
-            data = output.getvalue()[14:]  # Remove BMP header
-            output.close()
+            # Build the CF_DIB directly: BITMAPINFOHEADER + bottom-up 32-bit
+            # BGRX rows (no row padding), packed by PIL's raw encoder
+            img = pil_image if pil_image.mode == "RGB" else pil_image.convert("RGB")
+            width, height = img.size
+            pixels = img.tobytes("raw", "BGRX", 0, -1)
+            header = struct.pack('<IiiHHIIiiII', 40, width, height, 1, 32, 0,
+                                 len(pixels), 0, 0, 0, 0)
+            data = header + pixels
             
             # Copy to clipboard
             win32clipboard.OpenClipboard()
@@ -170,6 +183,29 @@ class ImageSearchHandler:
             print(f"[ERROR] Clipboard copy failed: {e}")
             return False
 
+class ImageSearchTask(QRunnable):
+    """Saves/copies the captured image and opens the search page off the GUI thread"""
+    
+    def __init__(self, handler, pil_image, engine, clipboard_done=False):
+        super().__init__()
+        self.handler = handler
+        self.pil_image = pil_image
+        self.engine = engine
+        self.clipboard_done = clipboard_done
+    
+    def run(self):
+        self.handler.perform_image_search(self.pil_image, self.engine, self.clipboard_done)
+
+class OpenUrlTask(QRunnable):
+    """Launches the browser off the GUI thread (ShellExecute can be slow)"""
+    
+    def __init__(self, url):
+        super().__init__()
+        self.url = url
+    
+    def run(self):
+        webbrowser.open(self.url)
+
 # Enhanced Search Engine with Google Focus
 class EnhancedSearchEngine:
     """Enhanced search engine with Google focus and proper image search"""
@@ -190,7 +226,7 @@ class EnhancedSearchEngine:
             # Always use Google for text search
             url = f"https://www.google.com/search?q={encoded_query}"
             
-            webbrowser.open(url)
+            QThreadPool.globalInstance().start(OpenUrlTask(url))
             print(f"[INFO] 🔍 Google text search: '{clean_query[:50]}{'...' if len(clean_query) > 50 else ''}'")
             return True
             
@@ -210,7 +246,7 @@ class EnhancedSearchEngine:
             # Always use Google Images
             url = f"https://www.google.com/search?tbm=isch&q={encoded_query}"
             
-            webbrowser.open(url)
+            QThreadPool.globalInstance().start(OpenUrlTask(url))
             print(f"[INFO] 🖼️ Google image search: '{clean_query[:50]}{'...' if len(clean_query) > 50 else ''}'")
             return True
             
@@ -218,25 +254,64 @@ class EnhancedSearchEngine:
             print(f"[ERROR] Image search by text failed: {e}")
             return False
     
-    def search_image(self, pil_image=None):
-        """Perform reverse image search on Google"""
+    def search_image(self, pil_image=None, qimage=None):
+        """Perform reverse image search on Google
+        
+        If a QImage of the capture is given it goes on the clipboard here,
+        through Qt on the GUI thread, instead of win32clipboard on the worker.
+        """
         if pil_image:
-            return self.image_handler.perform_image_search(pil_image, 'google')
+            if qimage is not None:
+                QApplication.clipboard().setImage(qimage)
+            # JPEG encode + clipboard copy can take hundreds of ms on big crops
+            QThreadPool.globalInstance().start(ImageSearchTask(
+                self.image_handler, pil_image, 'google', clipboard_done=qimage is not None))
+            return True
         else:
             print("[WARNING] No image provided for reverse search")
             return False
 
 # Global OCR Reader
 EASYOCR_READER = None
+EASYOCR_READER_LOCK = threading.Lock()
+
+def _cuda_available():
+    """Check for a usable CUDA device (torch is imported lazily)"""
+    try:
+        import torch
+        return torch.cuda.is_available()
+    except Exception:
+        return False
 
 def get_ocr_reader():
     """Creates or returns the singleton OCR reader instance."""
     global EASYOCR_READER
-    if EASYOCR_READER is None:
-        print("[INFO] Initializing EasyOCR Reader...")
-        EASYOCR_READER = easyocr.Reader(['en'], gpu=False)
-        print("[INFO] EasyOCR Reader initialized.")
-    return EASYOCR_READER
+    with EASYOCR_READER_LOCK:
+        if EASYOCR_READER is None:
+            print("[INFO] Initializing EasyOCR Reader...")
+            import easyocr  # pulls in torch; imported here so startup isn't blocked
+            reader = None
+            if _cuda_available():
+                try:
+                    reader = easyocr.Reader(['en'], gpu=True, cudnn_benchmark=True)
+                    print("[INFO] EasyOCR running on GPU")
+                except Exception as e:
+                    print(f"[WARNING] GPU OCR unavailable, using CPU: {e}")
+            if reader is None:
+                reader = easyocr.Reader(['en'], gpu=False)
+            
+            # Warm up so cuDNN autotuning happens before the first real capture
+            reader.readtext(numpy.zeros((64, 64, 3), dtype=numpy.uint8))
+            EASYOCR_READER = reader
+            print("[INFO] EasyOCR Reader initialized.")
+        return EASYOCR_READER
+
+def _preload_ocr_reader():
+    """Load the OCR model in the background so the first capture doesn't wait"""
+    try:
+        get_ocr_reader()
+    except Exception as e:
+        print(f"[WARNING] OCR preload failed: {e}")
 
 class GlobalHotkeyListener(QObject):
     """Global hotkey listener using pynput for system-wide shortcuts"""
@@ -246,6 +321,7 @@ class GlobalHotkeyListener(QObject):
         super().__init__()
         self.active = False
         self.listener = None
+        self._stop = threading.Event()
 
     def start_listening(self):
         """Start global hotkey listening"""
@@ -258,6 +334,7 @@ class GlobalHotkeyListener(QObject):
             
         try:
             self.active = True
+            self._stop.clear()
             # Start listener in a separate thread
             listener_thread = threading.Thread(target=self._run_listener, daemon=True)
             listener_thread.start()
@@ -274,8 +351,8 @@ class GlobalHotkeyListener(QObject):
                 '<ctrl>+<shift>+<space>': self._on_hotkey,
                 '<ctrl>+<alt>+s': self._on_hotkey
             }) as self.listener:
-                while self.active:
-                    time.sleep(0.1)
+                # Block until stop_listening() instead of polling self.active
+                self._stop.wait()
         except Exception as e:
             print(f"[ERROR] Hotkey listener error: {e}")
 
@@ -288,6 +365,7 @@ class GlobalHotkeyListener(QObject):
     def stop_listening(self):
         """Stop hotkey listening"""
         self.active = False
+        self._stop.set()
         if self.listener:
             try:
                 self.listener.stop()
@@ -300,8 +378,6 @@ class FallbackHotkeyListener(QObject):
 
     def __init__(self):
         super().__init__()
-        self.timer = QTimer()
-        self.timer.timeout.connect(self._check_fallback)
         
     def start_listening(self):
         """Start fallback method"""
@@ -320,10 +396,6 @@ class FallbackHotkeyListener(QObject):
         
         return True
     
-    def _check_fallback(self):
-        """Check for fallback activation"""
-        pass
-    
     def _on_hotkey(self):
         """Handle fallback hotkey"""
         print("[DEBUG] 🎯 F12 hotkey activated!")
@@ -335,28 +407,130 @@ class FallbackHotkeyListener(QObject):
             self.widget.close()
 
 class SimpleOcrWorker(QThread):
-    """OCR worker with enhanced image search support"""
-    finished = Signal(str)
+    """OCR worker; captures queued together are recognised in one batch"""
+    finished = Signal(list)  # one text per image, in order
     error = Signal(str)
+    
+    MAX_SIDE = 1280  # larger captures are downscaled before detection
 
-    def __init__(self, pil_image):
+    def __init__(self, images):
         super().__init__()
-        self.pil_image = pil_image
+        self.images = images
 
     def run(self):
         """Run OCR processing"""
         try:
             reader = get_ocr_reader()
-            image_np = numpy.array(self.pil_image)
-            result = reader.readtext(image_np)
+            images = [self._downscale(image) for image in self.images]
             
-            recognized_texts = [text for bbox, text, conf in result if conf > 0.3]
-            full_text = "\n".join(recognized_texts)
+            if len(images) == 1:
+                # Gather the strided RGB view into the contiguous array OpenCV needs
+                batch = [numpy.ascontiguousarray(images[0])]
+            else:
+                # readtext_batched needs equal sizes: pad (don't stretch) each
+                # capture into a common canvas, which also gathers the views
+                h = max(image.shape[0] for image in images)
+                w = max(image.shape[1] for image in images)
+                batch = []
+                for image in images:
+                    padded = numpy.zeros((h, w, 3), dtype=numpy.uint8)
+                    padded[:image.shape[0], :image.shape[1]] = image
+                    batch.append(padded)
+            
+            # _downscale already caps the detector input at 1280 px; recognise
+            # lines in batches (EasyOCR already decodes greedily by default)
+            if len(batch) == 1:
+                results = [reader.readtext(batch[0], batch_size=16)]
+            else:
+                results = reader.readtext_batched(batch, batch_size=16)
             
-            self.finished.emit(full_text)
+            # Detection thresholds don't gate recognition, so drop low-confidence text
+            self.finished.emit([
+                "\n".join(text for bbox, text, conf in result if conf > 0.3)
+                for result in results
+            ])
         except Exception as e:
             self.error.emit(f"OCR Error: {repr(e)}")
 
+    def _downscale(self, image):
+        """Shrink captures whose long side exceeds MAX_SIDE (area filter); others pass through"""
+        h, w = image.shape[:2]
+        longest = max(h, w)
+        if longest <= self.MAX_SIDE:
+            return image
+        import cv2
+        scale = self.MAX_SIDE / longest
+        return cv2.resize(numpy.ascontiguousarray(image),
+                          (max(1, int(w * scale)), max(1, int(h * scale))),
+                          interpolation=cv2.INTER_AREA)
+
+# Side panel styling, built once at import and applied as a single sheet
+SIDE_PANEL_BUTTON_COLORS = {
+    "searchTextBtn": "#4CAF50",
+    "searchImagesBtn": "#FF9800",
+    "imageSearchBtn": "#2196F3",
+    "copyBtn": "#607D8B",
+    "translateBtn": "#9C27B0",
+    "closeBtn": "#F44336",
+}
+
+def _button_rules(name, color):
+    """Per-button QSS rules, keyed on the button's objectName"""
+    return f"""
+    QPushButton#{name} {{
+        background-color: {color};
+    }}
+    QPushButton#{name}:hover {{
+        background-color: {color}CC;
+    }}
+    QPushButton#{name}:pressed {{
+        background-color: {color}AA;
+    }}
+    QPushButton#{name}:disabled {{
+        background-color: #CCCCCC;
+        color: #666666;
+    }}
+"""
+
+SIDE_PANEL_STYLE = """
+    QWidget {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #f8f9fa, stop:1 #e9ecef);
+        border: 3px solid #667eea;
+        border-radius: 15px;
+    }
+    QLabel#panelHeader {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #667eea, stop:1 #764ba2);
+        color: white;
+        font-size: 16px;
+        font-weight: bold;
+        padding: 15px;
+        border-radius: 10px;
+        margin-bottom: 10px;
+    }
+    QTextEdit {
+        border: 2px solid #ddd;
+        border-radius: 8px;
+        padding: 10px;
+        font-family: 'Consolas', monospace;
+        font-size: 11px;
+        background-color: #f9f9f9;
+    }
+    QTextEdit:focus {
+        border-color: #667eea;
+        background-color: white;
+    }
+    QPushButton {
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 10px;
+        font-weight: bold;
+        font-size: 11px;
+    }
+""" + "".join(_button_rules(name, color) for name, color in SIDE_PANEL_BUTTON_COLORS.items())
+
 class EnhancedSidePanel(QWidget):
     """Enhanced side panel with Google-focused search"""
     
@@ -378,18 +552,7 @@ class EnhancedSidePanel(QWidget):
         
         # Header
         header = QLabel("🔍 Circle to Search Results")
-        header.setStyleSheet("""
-            QLabel {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #667eea, stop:1 #764ba2);
-                color: white;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 15px;
-                border-radius: 10px;
-                margin-bottom: 10px;
-            }
-        """)
+        header.setObjectName("panelHeader")
         header.setAlignment(Qt.AlignCenter)
         layout.addWidget(header)
         
@@ -397,20 +560,6 @@ class EnhancedSidePanel(QWidget):
         self.text_edit = QTextEdit()
         self.text_edit.setPlaceholderText("Recognized text will appear here...")
         self.text_edit.setFixedHeight(150)
-        self.text_edit.setStyleSheet("""
-            QTextEdit {
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                padding: 10px;
-                font-family: 'Consolas', monospace;
-                font-size: 11px;
-                background-color: #f9f9f9;
-            }
-            QTextEdit:focus {
-                border-color: #667eea;
-                background-color: white;
-            }
-        """)
         layout.addWidget(self.text_edit)
         
         # Search buttons
@@ -421,12 +570,12 @@ class EnhancedSidePanel(QWidget):
         
         self.search_text_btn = QPushButton("🔍 Search on Google")
         self.search_text_btn.clicked.connect(self.search_text)
-        self.search_text_btn.setStyleSheet(self.get_button_style("#4CAF50"))
+        self.search_text_btn.setObjectName("searchTextBtn")
         text_buttons_layout.addWidget(self.search_text_btn)
         
         self.search_images_btn = QPushButton("🖼️ Google Images")
         self.search_images_btn.clicked.connect(self.search_images_by_text)
-        self.search_images_btn.setStyleSheet(self.get_button_style("#FF9800"))
+        self.search_images_btn.setObjectName("searchImagesBtn")
         text_buttons_layout.addWidget(self.search_images_btn)
         
         search_layout.addLayout(text_buttons_layout)
@@ -434,7 +583,7 @@ class EnhancedSidePanel(QWidget):
         # Image search button (prominent)
         self.image_search_btn = QPushButton("📷 Search Image on Google")
         self.image_search_btn.clicked.connect(self.search_image)
-        self.image_search_btn.setStyleSheet(self.get_button_style("#2196F3"))
+        self.image_search_btn.setObjectName("imageSearchBtn")
         self.image_search_btn.setFixedHeight(50)
         search_layout.addWidget(self.image_search_btn)
         
@@ -445,12 +594,12 @@ class EnhancedSidePanel(QWidget):
         
         self.copy_btn = QPushButton("📋 Copy")
         self.copy_btn.clicked.connect(self.copy_text)
-        self.copy_btn.setStyleSheet(self.get_button_style("#607D8B"))
+        self.copy_btn.setObjectName("copyBtn")
         features_layout.addWidget(self.copy_btn)
         
         self.translate_btn = QPushButton("🌐 Translate")
         self.translate_btn.clicked.connect(self.translate_text)
-        self.translate_btn.setStyleSheet(self.get_button_style("#9C27B0"))
+        self.translate_btn.setObjectName("translateBtn")
         features_layout.addWidget(self.translate_btn)
         
         layout.addLayout(features_layout)
@@ -460,46 +609,15 @@ class EnhancedSidePanel(QWidget):
         
         self.close_btn = QPushButton("❌ Close")
         self.close_btn.clicked.connect(self.hide)
-        self.close_btn.setStyleSheet(self.get_button_style("#F44336"))
+        self.close_btn.setObjectName("closeBtn")
         action_layout.addWidget(self.close_btn)
         
         layout.addLayout(action_layout)
         
         self.setLayout(layout)
         
-        # Overall styling
-        self.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #f8f9fa, stop:1 #e9ecef);
-                border: 3px solid #667eea;
-                border-radius: 15px;
-            }
-        """)
-    
-    def get_button_style(self, color):
-        """Get button styling"""
-        return f"""
-            QPushButton {{
-                background-color: {color};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px;
-                font-weight: bold;
-                font-size: 11px;
-            }}
-            QPushButton:hover {{
-                background-color: {color}CC;
-            }}
-            QPushButton:pressed {{
-                background-color: {color}AA;
-            }}
-            QPushButton:disabled {{
-                background-color: #CCCCCC;
-                color: #666666;
-            }}
-        """
+        # Overall styling: one sheet for the panel and all of its children
+        self.setStyleSheet(SIDE_PANEL_STYLE)
     
     def set_content(self, text, image, search_engine):
         """Set content for the panel"""
@@ -553,13 +671,8 @@ class EnhancedSidePanel(QWidget):
         """Copy text to clipboard"""
         text = self.text_edit.toPlainText().strip()
         if text:
-            try:
-                pyperclip.copy(text)
-                self.show_feedback("📋 Text copied!")
-            except Exception:
-                clipboard = QApplication.clipboard()
-                clipboard.setText(text)
-                self.show_feedback("📋 Text copied!")
+            QApplication.clipboard().setText(text)
+            self.show_feedback("📋 Text copied!")
     
     def translate_text(self):
         """Translate text"""
@@ -597,6 +710,9 @@ class EnhancedSidePanel(QWidget):
 class DirectHotkeyApplication(QObject):
     """Direct hotkey application without tray icon - overlay focused"""
     
+    BATCH_WINDOW_MS = 50  # how long to wait for more captures before OCR
+    MAX_BATCH = 4
+    
     def __init__(self, app: QApplication):
         super().__init__()
         self.app = app
@@ -605,13 +721,31 @@ class DirectHotkeyApplication(QObject):
         # Core components
         self.search_engine = EnhancedSearchEngine()
         
+        # Start loading the OCR model now instead of on the first capture
+        self._preload = threading.Thread(target=_preload_ocr_reader, daemon=True)
+        self._preload.start()
+        
         # UI Components
         self.overlay = OverlayWindow()
         self.side_panel = EnhancedSidePanel()
         
+        # One screen grabber for the app's lifetime (captures run on the GUI thread)
+        import mss
+        self._sct = mss.mss()
+        self.app.aboutToQuit.connect(self._sct.close)
+        
         # State
         self.ocr_worker = None
         self.last_selection_rect = None
+        
+        # Captures made in quick succession are OCR'd as one batch
+        self._pending_captures = collections.deque()
+        self._in_flight = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.BATCH_WINDOW_MS)
+        self._flush_timer.timeout.connect(self._flush_pending_captures)
+        self.last_capture = None
         self.last_captured_image = None
         
         # Setup only hotkeys (no tray)
@@ -658,7 +792,6 @@ class DirectHotkeyApplication(QObject):
         """Handle region selection"""
         print(f"[DEBUG] Region selected: {rect}")
         
-        self.last_selection_rect = rect
         screen = QGuiApplication.primaryScreen()
         pixel_ratio = screen.devicePixelRatio()
         
@@ -670,27 +803,75 @@ class DirectHotkeyApplication(QObject):
         }
         
         try:
-            with mss.mss() as sct:
-                sct_img = sct.grab(capture_rect)
-                pil_img = Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
-                
-                self.last_captured_image = pil_img.copy()
-                
-                print("✅ Region captured, starting OCR...")
-                
-                if self.ocr_worker and self.ocr_worker.isRunning():
-                    self.ocr_worker.quit()
-                    self.ocr_worker.wait()
-
-                self.ocr_worker = SimpleOcrWorker(pil_img)
-                self.ocr_worker.finished.connect(self.handle_ocr_result)
-                self.ocr_worker.error.connect(self.handle_ocr_error)
-                self.ocr_worker.start()
-                
+            sct_img = self._sct.grab(capture_rect)
+            
+            # View the BGRA buffer as HxWx4 and reorder to RGB without copying
+            bgra = numpy.frombuffer(sct_img.raw, dtype=numpy.uint8).reshape(
+                sct_img.height, sct_img.width, 4)
+            rgb = bgra[:, :, 2::-1]
+            
+            print("✅ Region captured, starting OCR...")
+            
+            # Queue the capture; a short window lets rapid captures share a batch
+            self._pending_captures.append((rect, sct_img, rgb))
+            if not self._flush_timer.isActive():
+                self._flush_timer.start()
+            
         except Exception as e:
             print(f"[ERROR] Screen capture failed: {e}")
             QMessageBox.warning(None, "Capture Error", f"Failed to capture screen: {e}")
 
+    def _flush_pending_captures(self):
+        """Start OCR on the queued captures unless a batch is already running"""
+        if self._in_flight or not self._pending_captures:
+            return
+        
+        batch = []
+        while self._pending_captures and len(batch) < self.MAX_BATCH:
+            batch.append(self._pending_captures.popleft())
+        self._in_flight = batch
+        
+        # The previous worker has already reported back; let its thread exit
+        if self.ocr_worker:
+            self.ocr_worker.wait()
+        
+        self.ocr_worker = SimpleOcrWorker([rgb for _, _, rgb in batch])
+        self.ocr_worker.finished.connect(self._on_batch_finished)
+        self.ocr_worker.error.connect(self._on_batch_error)
+        self.ocr_worker.start()
+
+    def _on_batch_finished(self, texts):
+        """Dispatch each capture's text in order, then start the next batch"""
+        batch, self._in_flight = self._in_flight, []
+        for (rect, sct_img, _), text in zip(batch, texts):
+            # Keep the raw capture; the PIL image is only built if needed
+            self.last_selection_rect = rect
+            self.last_capture = sct_img
+            self.last_captured_image = None
+            self.handle_ocr_result(text)
+        self._flush_pending_captures()
+
+    def _on_batch_error(self, error_message):
+        self._in_flight = []
+        self.handle_ocr_error(error_message)
+        self._flush_pending_captures()
+
+    def get_captured_image(self):
+        """Build (once) the PIL image of the last capture for image search"""
+        if self.last_captured_image is None and self.last_capture is not None:
+            self.last_captured_image = Image.frombytes(
+                "RGB", self.last_capture.size, self.last_capture.raw, "raw", "BGRX")
+        return self.last_captured_image
+
+    def get_captured_qimage(self):
+        """QImage of the last capture, built straight on the BGRA buffer (no PIL)"""
+        sct_img = self.last_capture
+        if sct_img is None:
+            return None
+        # BGRA bytes are Qt's RGB32 layout; copy() detaches from the mss buffer
+        return QImage(sct_img.raw, sct_img.width, sct_img.height,
+                      sct_img.width * 4, QImage.Format_RGB32).copy()
+
     def handle_ocr_result(self, ocr_text):
         """Handle OCR results"""
         clean_text = ocr_text.strip()
@@ -698,11 +879,9 @@ class DirectHotkeyApplication(QObject):
         
         # Auto-copy to clipboard (no saving)
         if clean_text:
-            try:
-                pyperclip.copy(clean_text)
-                print("[INFO] Text copied to clipboard")
-            except Exception as e:
-                print(f"[WARNING] Could not copy to clipboard: {e}")
+            # Qt's clipboard is a direct call; pyperclip may spawn clip.exe
+            QApplication.clipboard().setText(clean_text)
+            print("[INFO] Text copied to clipboard")
         
         # Direct browser search - no panel, no saving
         if clean_text:
@@ -712,9 +891,10 @@ class DirectHotkeyApplication(QObject):
             print(f"🔍 Google search opened directly!")
         else:
             # If no text, open Google Images for reverse image search
-            if self.last_captured_image:
+            captured_image = self.get_captured_image()
+            if captured_image:
                 print("[INFO] 📷 No text found - opening Google Images for image search...")
-                self.search_engine.search_image(self.last_captured_image)
+                self.search_engine.search_image(captured_image, self.get_captured_qimage())
                 print(f"📷 Image Captured!")
                 print("📷 Google Images opened for reverse search!")
 
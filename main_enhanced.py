@@ -567,7 +567,7 @@ class EnhancedTrayApplication(QObject):
                 pil_img = Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
                 
                 # Store the original image
-                self.last_captured_image = pil_img.copy()
+                self.last_captured_image = pil_img
                 
                 print("✅ Image captured, starting OCR...")
                 
@@ -577,7 +577,7 @@ class EnhancedTrayApplication(QObject):
                     self.ocr_worker.wait()
 
                 # Enhance image for OCR
-                enhanced_img = self.image_processor.enhance_for_ocr(pil_img.copy())
+                enhanced_img = self.image_processor.enhance_for_ocr(pil_img)
                 
                 # Start OCR
                 self.ocr_worker = EnhancedOcrWorker(enhanced_img)
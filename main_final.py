@@ -3,8 +3,11 @@
 
 import sys
 import os
+import time
+import queue
 import threading
 import mss
+import cv2
 import easyocr
 import numpy
 import webbrowser
@@ -18,7 +21,17 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton, QLabel
 )
 from PySide6.QtGui import QIcon, QAction, QGuiApplication, QShortcut, QKeySequence
-from PySide6.QtCore import QObject, Signal, QThread, QTimer, QLockFile, QDir, QRect, Qt
+from PySide6.QtCore import (
+    QObject, Signal, QTimer, QLockFile, QDir, QRect, Qt,
+    QRunnable, QThreadPool
+)
+
+# Faster screen capture on Windows (Desktop Duplication API)
+try:
+    import dxcam
+    DXCAM_AVAILABLE = sys.platform == "win32"
+except ImportError:
+    DXCAM_AVAILABLE = False
 
 # Simple imports that we know work
 from overlay import OverlayWindow
@@ -57,9 +70,8 @@ class ImageSearchHandler:
             image_filename = f"capture_{timestamp}.jpg"
             image_path = os.path.join(self.save_dir, image_filename)
             
-            # Optimize and save image
-            img = pil_image.copy()
-            img.save(image_path, "JPEG", quality=95, optimize=True)
+            # save() doesn't mutate the image, so no copy is needed
+            pil_image.save(image_path, "JPEG", quality=95)
             
             # Save text file if there's OCR text
             if ocr_text.strip():
@@ -124,13 +136,14 @@ class ImageSearchHandler:
             
             image_path = os.path.join(desktop_path, "circle_search_image.jpg")
             
-            # Optimize image size
-            img = pil_image.copy()
+            # Optimize image size (thumbnail() resizes in place, so copy only then)
+            img = pil_image
             max_size = (1920, 1080)
             if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
+                img = pil_image.copy()
                 img.thumbnail(max_size, Image.Resampling.LANCZOS)
             
-            img.save(image_path, "JPEG", quality=90, optimize=True)
+            img.save(image_path, "JPEG", quality=90)
             return image_path
             
         except Exception as e:
@@ -164,6 +177,74 @@ class ImageSearchHandler:
             print(f"[ERROR] Clipboard copy failed: {e}")
             return False
 
+class CaptureSaveSignals(QObject):
+    """Signals for background capture saves"""
+    saved = Signal(str, str)  # image path ('' on failure), recognized text
+
+class CaptureSaveTask(QRunnable):
+    """Saves the capture (JPEG + text) and copies the text off the GUI thread"""
+    
+    def __init__(self, handler, pil_image, ocr_text, signals):
+        super().__init__()
+        self.handler = handler
+        self.pil_image = pil_image
+        self.ocr_text = ocr_text
+        self.signals = signals
+    
+    def run(self):
+        image_path, _ = self.handler.save_capture_permanently(self.pil_image, self.ocr_text)
+        
+        # Auto-copy to clipboard (pyperclip does a Win32 round trip)
+        if self.ocr_text:
+            try:
+                pyperclip.copy(self.ocr_text)
+                print("[INFO] Text copied to clipboard")
+            except Exception as e:
+                print(f"[WARNING] Could not copy to clipboard: {e}")
+        
+        self.signals.saved.emit(image_path or '', self.ocr_text)
+
+class ScreenCapturer:
+    """Grabs screen regions as BGR(A) numpy arrays: DXcam on Windows, mss otherwise"""
+    
+    def __init__(self):
+        self._camera = None
+        self._sct = None
+        if DXCAM_AVAILABLE:
+            try:
+                self._camera = dxcam.create(output_color="BGR")
+                print("[INFO] Using DXcam for screen capture")
+            except Exception as e:
+                print(f"[WARNING] DXcam unavailable, using mss: {e}")
+    
+    def grab(self, capture_rect):
+        """Return an HxWx3 (BGR) or HxWx4 (BGRA) uint8 array of the region"""
+        if self._camera is not None:
+            left, top = capture_rect["left"], capture_rect["top"]
+            region = (left, top, left + capture_rect["width"], top + capture_rect["height"])
+            try:
+                # None means no new frame since the last grab; fall back to mss
+                frame = self._camera.grab(region=region)
+                if frame is not None:
+                    return frame
+            except Exception as e:
+                # e.g. a region on another monitor than the camera's output
+                print(f"[DEBUG] DXcam grab failed, using mss: {e}")
+        
+        if self._sct is None:
+            self._sct = mss.mss()
+        sct_img = self._sct.grab(capture_rect)
+        return numpy.frombuffer(sct_img.raw, dtype=numpy.uint8).reshape(
+            sct_img.height, sct_img.width, 4)
+    
+    def close(self):
+        if self._camera is not None:
+            self._camera.release()
+            self._camera = None
+        if self._sct is not None:
+            self._sct.close()
+            self._sct = None
+
 # Enhanced Search Engine with Image Support
 class EnhancedSearchEngine:
     """Enhanced search engine with proper image search"""
@@ -228,15 +309,40 @@ class EnhancedSearchEngine:
 
 # Global OCR Reader
 EASYOCR_READER = None
+EASYOCR_READER_LOCK = threading.Lock()
+
+def _use_gpu():
+    """Use CUDA when available, unless CTS_FORCE_CPU is set (torch is imported lazily)"""
+    if os.environ.get("CTS_FORCE_CPU"):
+        return False
+    try:
+        import torch
+        return torch.cuda.is_available()
+    except Exception:
+        return False
 
 def get_ocr_reader():
     """Creates or returns the singleton OCR reader instance."""
     global EASYOCR_READER
-    if EASYOCR_READER is None:
-        print("[INFO] Initializing EasyOCR Reader...")
-        EASYOCR_READER = easyocr.Reader(['en'], gpu=False)
-        print("[INFO] EasyOCR Reader initialized.")
-    return EASYOCR_READER
+    with EASYOCR_READER_LOCK:
+        if EASYOCR_READER is None:
+            print("[INFO] Initializing EasyOCR Reader...")
+            use_gpu = _use_gpu()
+            # quantize only affects the CPU models (int8 dynamic quantization)
+            reader = easyocr.Reader(['en'], gpu=use_gpu, cudnn_benchmark=use_gpu, quantize=True)
+            
+            # Warm up so cuDNN kernel selection happens before the first real capture
+            reader.readtext(numpy.zeros((64, 64, 3), dtype=numpy.uint8))
+            EASYOCR_READER = reader
+            print(f"[INFO] EasyOCR Reader initialized ({'GPU' if use_gpu else 'CPU'}).")
+        return EASYOCR_READER
+
+def _preload_ocr_reader():
+    """Load the OCR model in the background so the first capture doesn't wait"""
+    try:
+        get_ocr_reader()
+    except Exception as e:
+        print(f"[WARNING] OCR preload failed: {e}")
 
 class SimpleHotkeyListener(QObject):
     """Reliable Qt-based hotkey listener"""
@@ -268,26 +374,93 @@ class SimpleHotkeyListener(QObject):
         print("[DEBUG] 🎯 Hotkey activated!")
         self.hotkey_pressed.emit()
 
-class SimpleOcrWorker(QThread):
-    """OCR worker with enhanced image search support"""
-    finished = Signal(str)
+class OcrService(QObject):
+    """Persistent OCR thread; captures queued together are recognised in one batch"""
+    finished = Signal(object, str)  # capture context, recognized text
     error = Signal(str)
-
-    def __init__(self, pil_image):
+    
+    MAX_SIDE = 1280  # plenty for 14-20pt screen text; larger captures are shrunk
+    MAX_PENDING = 4  # most captures recognised in one batch
+    BATCH_WINDOW = 0.05  # seconds to wait for more captures to batch
+    
+    def __init__(self):
         super().__init__()
-        self.pil_image = pil_image
-
-    def run(self):
-        """Run OCR processing"""
+        self.requests = queue.Queue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+    
+    def submit(self, image_np, context):
+        """Queue an RGB array for OCR; context is handed back with its text"""
+        self.requests.put((image_np, context))
+    
+    def stop(self):
+        self.requests.put(None)
+    
+    def _run(self):
+        while True:
+            item = self.requests.get()
+            if item is None:
+                break
+            
+            # Coalesce captures made in rapid succession into one batch
+            batch = [item]
+            stopping = False
+            deadline = time.monotonic() + self.BATCH_WINDOW
+            while len(batch) < self.MAX_PENDING:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self.requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            self._process(batch)
+            if stopping:
+                break
+    
+    def _prepare(self, image_np):
+        """Contiguous copy of the capture, shrunk to the detector canvas if larger"""
+        # Gather the strided RGB view into the contiguous array OpenCV needs
+        image_np = numpy.ascontiguousarray(image_np)
+        
+        # Shrink to the detector canvas up front instead of letting CRAFT
+        # run on a full-resolution (up to 2560px) tensor
+        h, w = image_np.shape[:2]
+        scale = min(1.0, self.MAX_SIDE / max(h, w))
+        if scale < 1.0:
+            image_np = cv2.resize(image_np, (max(1, int(w * scale)), max(1, int(h * scale))),
+                                  interpolation=cv2.INTER_LINEAR)
+        return image_np
+    
+    def _process(self, batch):
+        """Run OCR on a batch; results are emitted in submission order"""
         try:
             reader = get_ocr_reader()
-            image_np = numpy.array(self.pil_image)
-            result = reader.readtext(image_np)
+            images = [self._prepare(image_np) for image_np, _ in batch]
             
-            recognized_texts = [text for bbox, text, conf in result if conf > 0.3]
-            full_text = "\n".join(recognized_texts)
+            if len(images) == 1:
+                results = [reader.readtext(images[0], canvas_size=self.MAX_SIDE, mag_ratio=1.0)]
+            else:
+                # readtext_batched needs equal sizes: letterbox (pad, don't
+                # stretch) every capture into a common canvas
+                h = max(image.shape[0] for image in images)
+                w = max(image.shape[1] for image in images)
+                padded = []
+                for image in images:
+                    canvas = numpy.zeros((h, w, 3), dtype=numpy.uint8)
+                    canvas[:image.shape[0], :image.shape[1]] = image
+                    padded.append(canvas)
+                results = reader.readtext_batched(
+                    padded, canvas_size=self.MAX_SIDE, mag_ratio=1.0, batch_size=len(padded))
             
-            self.finished.emit(full_text)
+            for (_, context), result in zip(batch, results):
+                recognized_texts = [text for bbox, text, conf in result if conf > 0.3]
+                self.finished.emit(context, "\n".join(recognized_texts))
         except Exception as e:
             self.error.emit(f"OCR Error: {repr(e)}")
 
@@ -549,13 +722,25 @@ class DirectHotkeyApplication(QObject):
         # Core components
         self.search_engine = EnhancedSearchEngine()
         
+        # Start loading the OCR model now instead of on the first capture
+        self._preload = threading.Thread(target=_preload_ocr_reader, daemon=True)
+        self._preload.start()
+        
         # UI Components
         self.overlay = OverlayWindow()
         self.side_panel = EnhancedSidePanel()
         
         # State
-        self.ocr_worker = None
+        self.ocr_service = OcrService()
+        self.ocr_service.finished.connect(self.on_ocr_finished)
+        self.ocr_service.error.connect(self.handle_ocr_error)
+        self.app.aboutToQuit.connect(self.ocr_service.stop)
+        
+        # One capturer for the app's lifetime (captures run on the GUI thread)
+        self.capturer = ScreenCapturer()
+        self.app.aboutToQuit.connect(self.capturer.close)
         self.last_selection_rect = None
+        self.last_capture = None
         self.last_captured_image = None
         
         # Setup only hotkeys (no tray)
@@ -563,6 +748,8 @@ class DirectHotkeyApplication(QObject):
         
         # Connect signals
         self.overlay.region_selected.connect(self.on_region_selected)
+        self.save_signals = CaptureSaveSignals()
+        self.save_signals.saved.connect(self.on_capture_saved)
         
         print("[DEBUG] Direct Hotkey Circle to Search initialized!")
 
@@ -725,7 +912,6 @@ class DirectHotkeyApplication(QObject):
         """Handle region selection"""
         print(f"[DEBUG] Region selected: {rect}")
         
-        self.last_selection_rect = rect
         screen = QGuiApplication.primaryScreen()
         pixel_ratio = screen.devicePixelRatio()
         
@@ -737,55 +923,59 @@ class DirectHotkeyApplication(QObject):
         }
         
         try:
-            with mss.mss() as sct:
-                sct_img = sct.grab(capture_rect)
-                pil_img = Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
-                
-                self.last_captured_image = pil_img.copy()
-                
-                print("✅ Region captured, starting OCR...")
-                
-                if self.ocr_worker and self.ocr_worker.isRunning():
-                    self.ocr_worker.quit()
-                    self.ocr_worker.wait()
-
-                self.ocr_worker = SimpleOcrWorker(pil_img)
-                self.ocr_worker.finished.connect(self.handle_ocr_result)
-                self.ocr_worker.error.connect(self.handle_ocr_error)
-                self.ocr_worker.start()
-                
+            frame = self.capturer.grab(capture_rect)
+            
+            # Reorder BGR(A) to RGB as a view, without copying
+            rgb = frame[:, :, 2::-1]
+            
+            print("✅ Region captured, starting OCR...")
+            
+            # Queue for the OCR thread; rapid captures share one batch
+            self.ocr_service.submit(rgb, (rect, frame))
+            
         except Exception as e:
             print(f"[ERROR] Screen capture failed: {e}")
             QMessageBox.warning(None, "Capture Error", f"Failed to capture screen: {e}")
 
+    def on_ocr_finished(self, context, ocr_text):
+        """Make the recognised capture current, then handle its text"""
+        rect, frame = context
+        
+        # Keep the raw capture as the source of truth; PIL is built on demand
+        self.last_selection_rect = rect
+        self.last_capture = frame
+        self.last_captured_image = None
+        self.handle_ocr_result(ocr_text)
+
+    def get_captured_image(self):
+        """Build (once) the PIL image of the last capture for saving and image search"""
+        if self.last_captured_image is None and self.last_capture is not None:
+            self.last_captured_image = Image.fromarray(
+                numpy.ascontiguousarray(self.last_capture[:, :, 2::-1]))
+        return self.last_captured_image
+
     def handle_ocr_result(self, ocr_text):
         """Handle OCR results"""
         clean_text = ocr_text.strip()
         print(f"✅ OCR Result: {clean_text}")
         
-        # Save captured files permanently
-        image_path, text_path = self.search_engine.image_handler.save_capture_permanently(
-            self.last_captured_image, clean_text
-        )
-        
-        # Auto-copy to clipboard
-        if clean_text:
-            try:
-                pyperclip.copy(clean_text)
-                print("[INFO] Text copied to clipboard")
-            except Exception as e:
-                print(f"[WARNING] Could not copy to clipboard: {e}")
-        
         # Auto-search on Google if text is found
         if clean_text and self.search_engine.auto_search:
             print("[INFO] 🔍 Auto-searching on Google...")
             self.search_engine.search_text(clean_text)
         
         # Show results with enhanced image search
-        self.side_panel.set_content(clean_text, self.last_captured_image, self.search_engine)
+        captured_image = self.get_captured_image()
+        self.side_panel.set_content(clean_text, captured_image, self.search_engine)
         self.side_panel.show_panel(self.last_selection_rect)
         
-        # Show notification with file save info
+        # Save captured files permanently (and copy the text) in the background;
+        # the notification follows once the file name is known
+        QThreadPool.globalInstance().start(CaptureSaveTask(
+            self.search_engine.image_handler, captured_image, clean_text, self.save_signals))
+
+    def on_capture_saved(self, image_path, clean_text):
+        """Show the notification with file save info"""
         if clean_text:
             save_info = f"Saved to: {os.path.basename(image_path)}" if image_path else ""
             self.tray_icon.showMessage(
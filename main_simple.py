@@ -2,18 +2,20 @@
 
 import sys
 import os
+import argparse
 import threading
-import asyncio
+import time
 import mss
-import easyocr
+import cv2
 import numpy
 from pynput import keyboard
 
 # PySide6 Imports
-from PySide6.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QMessageBox
+from PySide6.QtWidgets import QApplication, QSystemTrayIcon, QMenu
 from PySide6.QtGui import QIcon, QAction, QGuiApplication
 from PySide6.QtCore import (
-    QObject, Signal, QThread, QTimer, QLockFile, QDir, QRect, Qt
+    QObject, Signal, QLockFile, QDir, QRect, Qt,
+    QRunnable, QThreadPool
 )
 
 # Local Imports
@@ -25,18 +27,7 @@ from PIL import Image
 from core.search_engines import SearchEngineManager
 from core.image_search import ImageSearchHandler
 from utils.image_processing import ImageProcessor
-
-# --- LAZY LOADER FOR THE OCR MODEL ---
-EASYOCR_READER = None
-
-def get_ocr_reader():
-    """Creates or returns the singleton OCR reader instance."""
-    global EASYOCR_READER
-    if EASYOCR_READER is None:
-        print("[INFO] Initializing EasyOCR Reader for the first time... (this may take a moment)")
-        EASYOCR_READER = easyocr.Reader(['en'], gpu=False)
-        print("[INFO] EasyOCR Reader initialized.")
-    return EASYOCR_READER
+from utils.ocr_process import OcrProcess, DEFAULT_OCR_THREADS
 
 class HotkeyListener(QObject):
     """Listens for global hotkeys in a separate thread."""
@@ -46,6 +37,7 @@ class HotkeyListener(QObject):
         super().__init__()
         self.hotkey_combination = hotkey_combination
         self.listener = None
+        self._last_fire = 0.0
 
     def start_listening(self):
         listener_thread = threading.Thread(target=self._run, daemon=True)
@@ -59,42 +51,49 @@ class HotkeyListener(QObject):
             print(f"[ERROR] Failed to start hotkey listener: {e}")
 
     def _on_activate(self):
+        # Holding the combination re-fires it; ignore repeats within 250 ms
+        now = time.monotonic()
+        if now - self._last_fire < 0.25:
+            return
+        self._last_fire = now
         self.hotkey_pressed.emit()
 
-class EasyOcrWorker(QThread):
-    """Runs EasyOCR in a background thread."""
-    finished = Signal(str)
-    error = Signal(str)
+class OcrSignals(QObject):
+    """Signals emitted by OCR tasks running in the thread pool."""
+    finished = Signal(object, str)  # capture context, text
+    error = Signal(object, str)  # capture context, message
+
+class EasyOcrRunnable(QRunnable):
+    """Hands a capture to the OCR subprocess from a pooled background thread."""
 
-    def __init__(self, pil_image):
+    def __init__(self, image, signals, ocr_process, context=None):
         super().__init__()
-        self.pil_image = pil_image
+        self.image = image
+        self.signals = signals
+        self.ocr_process = ocr_process
+        self.context = context
 
     def run(self):
-        """Entry point for the thread."""
+        """Entry point for the pooled task."""
         try:
-            # Get the initialized OCR reader
-            reader = get_ocr_reader()
-
-            # Convert the Pillow image to a NumPy array, which EasyOCR expects
-            image_np = numpy.array(self.pil_image)
-
-            # Perform OCR
-            result = reader.readtext(image_np)
-
-            # Extract and join the recognized text
-            recognized_texts = [text for bbox, text, conf in result]
-            full_text = "\n".join(recognized_texts)
+            # EasyOCR expects a NumPy array; wait for the subprocess to recognize it
+            full_text = self.ocr_process.recognize(numpy.asarray(self.image))
 
-            self.finished.emit(full_text)
+            self.signals.finished.emit(self.context, full_text)
 
         except Exception as e:
-            self.error.emit(f"An error occurred during EasyOCR: {repr(e)}")
+            self.signals.error.emit(self.context, f"An error occurred during EasyOCR: {repr(e)}")
+
+def _set_dpi_policies():
+    """Applies the High-DPI policies; must run before QApplication is created."""
+    if sys.platform == "win32":
+        QGuiApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
 
 class TrayApplication(QObject):
-    def __init__(self, app: QApplication):
+    def __init__(self, app: QApplication, ocr_threads=DEFAULT_OCR_THREADS):
         super().__init__()
         self.app = app
+        self.ocr_threads = ocr_threads
         print("[DEBUG] Initializing TrayApplication...")
         
         # Initialize search components
@@ -108,14 +107,62 @@ class TrayApplication(QObject):
         
         self.overlay.region_selected.connect(self.on_region_selected)
 
-        self.ocr_worker = None
+        # OCR tasks reuse one pooled thread, which waits on the OCR subprocess
+        self.ocr_pool = QThreadPool(self)
+        self.ocr_pool.setMaxThreadCount(1)
+        self.ocr_signals = OcrSignals()
+        self.ocr_signals.finished.connect(self.handle_ocr_result)
+        self.ocr_signals.error.connect(self.handle_ocr_error)
+        self._last_err = 0.0
+        
         self.last_selection_rect = None
+        self.last_capture = None
         self.last_captured_image = None
+        # Context of the newest capture; results for older ones are dropped
+        self._pending_context = None
+
+        # Screen geometry / DPI, refreshed only when the screen setup changes
+        self._screens = []
+        self._primary_ratio = 1.0
+        for screen in QGuiApplication.screens():
+            self._watch_screen(screen)
+        self.app.screenAdded.connect(self._on_screen_added)
+        self.app.screenRemoved.connect(self._rebuild_screen_cache)
+        self._rebuild_screen_cache()
+
+        # One screen grabber for the app's lifetime (captures run on the GUI thread)
+        self._sct = mss.mss()
+        self.app.aboutToQuit.connect(self._sct.close)
 
         self.setup_tray_icon()
         self.setup_hotkey_listener()
+        # EasyOCR runs in its own process, which loads the model at startup
+        self.ocr_process = OcrProcess(self.ocr_threads)
+        self.ocr_process.start()
         print("[DEBUG] TrayApplication initialized successfully.")
 
+    def _watch_screen(self, screen):
+        screen.geometryChanged.connect(self._rebuild_screen_cache)
+        screen.physicalDotsPerInchChanged.connect(self._rebuild_screen_cache)
+        # devicePixelRatio follows the logical DPI (display scale changes)
+        screen.logicalDotsPerInchChanged.connect(self._rebuild_screen_cache)
+
+    def _on_screen_added(self, screen):
+        self._watch_screen(screen)
+        self._rebuild_screen_cache()
+
+    def _rebuild_screen_cache(self, *args):
+        """Cache each screen's geometry and device pixel ratio"""
+        self._screens = [(s.geometry(), s.devicePixelRatio()) for s in QGuiApplication.screens()]
+        primary = QGuiApplication.primaryScreen()
+        self._primary_ratio = primary.devicePixelRatio() if primary else 1.0
+
+    def _pixel_ratio_at(self, point):
+        for geometry, ratio in self._screens:
+            if geometry.contains(point):
+                return ratio
+        return self._primary_ratio
+
     def setup_tray_icon(self):
         icon_path = os.path.join(os.path.dirname(__file__), "assets/icon.png")
         if not os.path.exists(icon_path):
@@ -173,10 +220,7 @@ class TrayApplication(QObject):
         self.overlay.show_overlay()
 
     def on_region_selected(self, rect: QRect):
-        self.last_selection_rect = rect
-        selection_center = rect.center()
-        screen = QGuiApplication.screenAt(selection_center) or QGuiApplication.primaryScreen()
-        pixel_ratio = screen.devicePixelRatio()
+        pixel_ratio = self._pixel_ratio_at(rect.center())
         
         capture_rect = {
             "top": int(rect.top() * pixel_ratio),
@@ -185,47 +229,92 @@ class TrayApplication(QObject):
             "height": int(rect.height() * pixel_ratio),
         }
         
+        # Clip to the virtual desktop so no off-screen pixels are blitted
+        desktop = self._sct.monitors[0]
+        left = max(capture_rect["left"], desktop["left"])
+        top = max(capture_rect["top"], desktop["top"])
+        right = min(capture_rect["left"] + capture_rect["width"], desktop["left"] + desktop["width"])
+        bottom = min(capture_rect["top"] + capture_rect["height"], desktop["top"] + desktop["height"])
+        if right <= left or bottom <= top:
+            print("[WARNING] Selection is outside the visible screen area")
+            return
+        capture_rect = {"top": top, "left": left, "width": right - left, "height": bottom - top}
+        
         try:
-            with mss.mss() as sct:
-                sct_img = sct.grab(capture_rect)
-                pil_img = Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
-                
-                # Store the original image for image search
-                self.last_captured_image = pil_img.copy()
-                
-                print("✅ In-memory image captured. Starting OCR worker...")
-                
-                if self.ocr_worker and self.ocr_worker.isRunning():
-                    self.ocr_worker.quit()
-                    self.ocr_worker.wait()
-
-                # Enhance image for OCR
-                enhanced_img = self.image_processor.enhance_for_ocr(pil_img.copy())
-                
-                # Use EasyOCR worker
-                self.ocr_worker = EasyOcrWorker(enhanced_img)
-                self.ocr_worker.finished.connect(self.handle_ocr_result)
-                self.ocr_worker.error.connect(self.handle_ocr_error)
-                self.ocr_worker.start()
+            sct_img = self._sct.grab(capture_rect)
+            
+            # View the BGRA buffer as HxWx4 and reduce it to grayscale in one pass;
+            # EasyOCR works from the grey image and this ships 1/4 of the bytes
+            bgra = numpy.frombuffer(sct_img.raw, dtype=numpy.uint8).reshape(
+                sct_img.height, sct_img.width, 4)
+            gray = cv2.cvtColor(bgra, cv2.COLOR_BGRA2GRAY)
+            
+            print("✅ In-memory image captured. Starting OCR worker...")
+            
+            # Enhance image for OCR
+            enhanced_img = self.image_processor.enhance_for_ocr(gray)
+            
+            # Queue the EasyOCR task on the pool
+            self._pending_context = (rect, sct_img)
+            self.ocr_pool.start(EasyOcrRunnable(
+                enhanced_img, self.ocr_signals, self.ocr_process, self._pending_context))
+            
+            # Show the panel right away; the text is filled in when OCR finishes.
+            # Empty content keeps both search buttons disabled until then
+            self.side_panel.set_content("", None, self.search_manager)
+            self.side_panel.text_edit.setPlaceholderText("⏳ Recognising…")
+            self.side_panel.show_panel(rect)
         except Exception as e:
             print(f"[ERROR] Screen capture failed: {e}")
 
-    def handle_ocr_result(self, ocr_text):
+    def get_captured_image(self):
+        """Build (once) the PIL image of the last capture for image search"""
+        if self.last_captured_image is None and self.last_capture is not None:
+            self.last_captured_image = Image.frombytes(
+                "RGB", self.last_capture.size, self.last_capture.raw, "raw", "BGRX")
+        return self.last_captured_image
+
+    def handle_ocr_result(self, context, ocr_text):
+        if context is not self._pending_context:
+            return  # superseded by a newer capture
         clean_text = ocr_text.strip()
         print(f"Recognized Text: {clean_text}")
         
-        # Pass both text and image to side panel
-        self.side_panel.set_content(clean_text, self.last_captured_image, self.search_manager)
-        self.side_panel.show_panel(self.last_selection_rect)
-
-    def handle_ocr_error(self, error_message):
+        # Pass both text and image to the already visible side panel
+        self._update_side_panel(context, clean_text)
+
+    def _update_side_panel(self, context, text):
+        """Swap the panel's placeholder for the final content without flicker"""
+        # Make this result's capture current so text and image stay paired;
+        # the PIL image is only built for the side panel
+        self.last_selection_rect, self.last_capture = context
+        self.last_captured_image = None
+        
+        self.side_panel.setUpdatesEnabled(False)
+        try:
+            self.side_panel.text_edit.setPlaceholderText("Recognized text will appear here...")
+            self.side_panel.set_content(text, self.get_captured_image(), self.search_manager)
+        finally:
+            self.side_panel.setUpdatesEnabled(True)
+        if not self.side_panel.isVisible():
+            self.side_panel.show_panel(self.last_selection_rect)
+
+    def handle_ocr_error(self, context, error_message):
         print(f"[ERROR] OCR failed: {error_message}")
-        QMessageBox.warning(None, "OCR Error", error_message)
+        if context is not self._pending_context:
+            return  # superseded by a newer capture
+        # Clear the placeholder; image search still works without text
+        self._update_side_panel(context, "")
+        # Tray balloon instead of a modal box; at most one per second
+        now = time.monotonic()
+        if now - self._last_err < 1:
+            return
+        self._last_err = now
+        self.tray_icon.showMessage("OCR Error", error_message, QSystemTrayIcon.Warning, 3000)
 
 if __name__ == "__main__":
     # Set DPI policies before anything else
-    if sys.platform == "win32":
-        QGuiApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
+    _set_dpi_policies()
     
     print("--- Starting Circle to Search Application ---")
     
@@ -235,12 +324,17 @@ if __name__ == "__main__":
         print("[ERROR] Another instance is already running. Exiting.")
         sys.exit(0)
     
+    # Parse our own options; Qt gets the rest
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--ocr-threads", type=int, default=DEFAULT_OCR_THREADS)
+    args, qt_args = parser.parse_known_args()
+    
     # Create the QApplication object
-    app = QApplication(sys.argv)
+    app = QApplication(sys.argv[:1] + qt_args)
     app.setQuitOnLastWindowClosed(False)
 
     # Create our application controller
-    main_controller = TrayApplication(app)
+    main_controller = TrayApplication(app, ocr_threads=max(1, args.ocr_threads))
 
     print("🚀 Application started successfully!")
     print("📝 Instructions:")
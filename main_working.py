@@ -244,7 +244,7 @@ class WorkingTrayApplication(QObject):
                 sct_img = sct.grab(capture_rect)
                 pil_img = Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
                 
-                self.last_captured_image = pil_img.copy()
+                self.last_captured_image = pil_img
                 self.last_selection_rect = rect
                 
                 print("✅ Test capture successful, starting OCR...")
@@ -254,7 +254,7 @@ class WorkingTrayApplication(QObject):
                     self.ocr_worker.quit()
                     self.ocr_worker.wait()
 
-                enhanced_img = self.image_processor.enhance_for_ocr(pil_img.copy())
+                enhanced_img = self.image_processor.enhance_for_ocr(pil_img)
                 self.ocr_worker = SimpleOcrWorker(enhanced_img)
                 self.ocr_worker.finished.connect(self.handle_ocr_result)
                 self.ocr_worker.error.connect(self.handle_ocr_error)
@@ -283,7 +283,7 @@ class WorkingTrayApplication(QObject):
                 sct_img = sct.grab(capture_rect)
                 pil_img = Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
                 
-                self.last_captured_image = pil_img.copy()
+                self.last_captured_image = pil_img
                 
                 print("✅ Region captured, starting OCR...")
                 
@@ -291,7 +291,7 @@ class WorkingTrayApplication(QObject):
                     self.ocr_worker.quit()
                     self.ocr_worker.wait()
 
-                enhanced_img = self.image_processor.enhance_for_ocr(pil_img.copy())
+                enhanced_img = self.image_processor.enhance_for_ocr(pil_img)
                 self.ocr_worker = SimpleOcrWorker(enhanced_img)
                 self.ocr_worker.finished.connect(self.handle_ocr_result)
                 self.ocr_worker.error.connect(self.handle_ocr_error)
@@ -436,7 +436,7 @@ class EnhancedSidePanelWindow(QWidget):
                 if self.image_search_handler and self.image_processor:
                     # Enhanced image processing
                     enhanced_image = self.image_processor.enhance_for_search(self.current_image)
-                    image_bytes, temp_path = self.image_search_handler.prepare_image_for_search(enhanced_image)
+                    image_bytes, _ = self.image_search_handler.prepare_image_for_search(enhanced_image)
                     result = self.search_manager.search_image(image_data=image_bytes)
                     self.image_search_handler.cleanup_temp_files()
                 else:
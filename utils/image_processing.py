@@ -1,11 +1,53 @@
+import numpy as np
 from PIL import Image
 
+# EasyOCR's CRAFT detector runs fastest on bounded inputs: very large captures
+# cost far more time than the accuracy they add, while very small ones lose
+# characters, so captures are scaled into this range before OCR.
+OCR_MAX_SIDE = 1600
+OCR_MIN_SIDE = 300
+
 class ImageProcessor:
     @staticmethod
-    def enhance_for_ocr(pil_image: Image.Image):
-        """Basic enhancement for OCR"""
+    def enhance_for_ocr(pil_image):
+        """Basic enhancement for OCR (PIL images come back as RGB)
+        
+        Also accepts an HxWx3 RGB or HxW grayscale numpy array, which is returned untouched
+        unless it needs rescaling. The input is never modified in place, so
+        callers can share the captured image without copying it first.
+        """
+        if not isinstance(pil_image, Image.Image):
+            return ImageProcessor._rescale_array_for_ocr(pil_image)
+        
+        if pil_image.mode != 'RGB':
+            pil_image = pil_image.convert('RGB')
+        
+        longest = max(pil_image.size)
+        if longest > OCR_MAX_SIDE:
+            scale = OCR_MAX_SIDE / longest
+            size = (max(1, round(pil_image.width * scale)), max(1, round(pil_image.height * scale)))
+            # Box-reduce first, then bilinear: much cheaper than LANCZOS for text
+            pil_image = pil_image.resize(size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+        elif longest < OCR_MIN_SIDE:
+            pil_image = pil_image.resize((pil_image.width * 2, pil_image.height * 2), Image.Resampling.BICUBIC)
         return pil_image
     
+    @staticmethod
+    def _rescale_array_for_ocr(arr):
+        """Rescale an RGB or grayscale array into the OCR size range with OpenCV, staying in numpy"""
+        height, width = arr.shape[:2]
+        longest = max(width, height)
+        if OCR_MIN_SIDE <= longest <= OCR_MAX_SIDE:
+            return arr
+        
+        import cv2
+        arr = np.ascontiguousarray(arr)  # cv2 needs a contiguous buffer
+        if longest > OCR_MAX_SIDE:
+            scale = OCR_MAX_SIDE / longest
+            size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            return cv2.resize(arr, size, interpolation=cv2.INTER_AREA)
+        return cv2.resize(arr, (width * 2, height * 2), interpolation=cv2.INTER_CUBIC)
+    
     @staticmethod
     def enhance_for_search(pil_image: Image.Image):
         """Basic enhancement for search"""
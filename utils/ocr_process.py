@@ -0,0 +1,145 @@
+# EasyOCR worker process for main_simple, kept apart from the GUI modules so
+# the spawned child only imports numpy, easyocr and torch
+import os
+import sys
+import atexit
+import threading
+import queue
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy
+
+# --- LAZY LOADER FOR THE OCR MODEL ---
+EASYOCR_READER = None
+EASYOCR_READER_LOCK = threading.Lock()
+
+def get_ocr_reader():
+    """Creates or returns the singleton OCR reader instance."""
+    global EASYOCR_READER
+    with EASYOCR_READER_LOCK:
+        if EASYOCR_READER is None:
+            # Only the OCR subprocess needs easyocr (and the torch it pulls in)
+            import easyocr
+            print("[INFO] Initializing EasyOCR Reader for the first time... (this may take a moment)")
+            EASYOCR_READER = easyocr.Reader(['en'], gpu=False)
+            print("[INFO] EasyOCR Reader initialized.")
+        return EASYOCR_READER
+
+def _ocr_process_main(requests, results, num_threads):
+    """OCR subprocess loop: reads images from shared memory and returns their text."""
+    try:
+        # Cap torch's intra-op pool so OCR doesn't oversubscribe the CPU
+        import torch
+        torch.set_num_threads(num_threads)
+        torch.set_num_interop_threads(1)
+    except Exception as e:
+        print(f"[WARNING] Could not limit OCR threads: {e}")
+
+    try:
+        get_ocr_reader()  # Load the model as soon as the process starts
+    except Exception as e:
+        print(f"[WARNING] OCR warm-up failed: {e}")
+
+    while True:
+        request = requests.get()
+        if request is None:
+            break
+        request_id, shm_name, shape = request
+        try:
+            shm = shared_memory.SharedMemory(name=shm_name)
+            try:
+                image_np = numpy.ndarray(shape, dtype=numpy.uint8, buffer=shm.buf)
+                result = get_ocr_reader().readtext(image_np)
+                del image_np  # Release the view before closing the segment
+            finally:
+                shm.close()
+            full_text = "\n".join([text for bbox, text, conf in result])
+            results.put((request_id, full_text, None))
+        except Exception as e:
+            results.put((request_id, None, repr(e)))
+
+# Threads used by torch inside the OCR process (override with --ocr-threads N)
+DEFAULT_OCR_THREADS = 2
+
+class OcrProcess:
+    """Persistent EasyOCR subprocess, so inference runs outside this process's GIL."""
+
+    def __init__(self, num_threads=DEFAULT_OCR_THREADS):
+        self.num_threads = num_threads
+        self._context = multiprocessing.get_context("spawn")
+        self._process = None
+        self._requests = None
+        self._results = None
+        self._next_id = 0
+        self._lock = threading.Lock()
+        atexit.register(self.stop)
+
+    def start(self):
+        """Spawn the worker process (it loads the OCR model immediately)."""
+        # OpenMP/MKL read these when torch is imported in the child
+        os.environ["OMP_NUM_THREADS"] = str(self.num_threads)
+        os.environ["MKL_NUM_THREADS"] = str(self.num_threads)
+
+        self._requests = self._context.Queue()
+        self._results = self._context.Queue()
+        self._process = self._context.Process(
+            target=_ocr_process_main,
+            args=(self._requests, self._results, self.num_threads),
+            daemon=True
+        )
+
+        # spawn re-runs the launching script in the child as __mp_main__, which
+        # would pull in Qt, pynput, mss and the GUI modules; without a main path
+        # the child only imports this module
+        main_module = sys.modules["__main__"]
+        main_file = getattr(main_module, "__file__", None)
+        if main_file is not None and getattr(main_module, "__spec__", None) is None:
+            del main_module.__file__
+        try:
+            self._process.start()
+        finally:
+            if main_file is not None:
+                main_module.__file__ = main_file
+
+    def stop(self):
+        if self._process and self._process.is_alive():
+            self._requests.put(None)
+            self._process.join(timeout=2)
+            if self._process.is_alive():
+                self._process.terminate()
+        self._process = None
+
+    def recognize(self, image_np):
+        """Run OCR on an HxW or HxWx3 uint8 array and return the recognized text (blocking)."""
+        with self._lock:
+            if self._process is None or not self._process.is_alive():
+                self.start()
+
+            image_np = numpy.asarray(image_np, dtype=numpy.uint8)
+            shm = shared_memory.SharedMemory(create=True, size=max(image_np.nbytes, 1))
+            try:
+                # Share the pixels instead of pickling the whole bitmap; strided
+                # views are gathered in this one pass
+                numpy.ndarray(image_np.shape, dtype=numpy.uint8, buffer=shm.buf)[...] = image_np
+                self._next_id += 1
+                request_id = self._next_id
+                self._requests.put((request_id, shm.name, image_np.shape))
+
+                while True:
+                    try:
+                        result_id, text, error = self._results.get(timeout=0.5)
+                    except queue.Empty:
+                        # Don't wait forever on a child that crashed mid-request
+                        if not self._process.is_alive():
+                            self.stop()
+                            raise RuntimeError("OCR process exited unexpectedly")
+                        continue
+                    if result_id == request_id:
+                        break
+            finally:
+                shm.close()
+                shm.unlink()
+
+            if error:
+                raise RuntimeError(error)
+            return text